@@ -1,11 +1,21 @@
 import os
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-import pytz
+from types import MappingProxyType
+from typing import Mapping
+from zoneinfo import ZoneInfo
+
+@dataclass(frozen=True, slots=True)
+class PlatformConfig:
+    """Per-platform settings; read-only so the shared Config.PLATFORMS can't be mutated"""
+    enabled: bool = True
+    base_url: str = ""
+    search_params: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
 
 class Config:
     RESUME_FILE = "/workspaces/job-finder/resume/resume.md"
     MIN_MATCH_PCT = 70
-    TIMEZONE = pytz.timezone("Europe/Warsaw")
+    TIMEZONE = ZoneInfo("Europe/Warsaw")
     MAX_JOB_AGE_DAYS = 14
     
     # Location settings - can be customized
@@ -16,10 +26,17 @@ class Config:
     OUTPUT_DIR = "/tmp/job_search_results"
     CSV_OUTPUT = os.path.join(OUTPUT_DIR, "job_matches.csv")
     JSONL_OUTPUT = os.path.join(OUTPUT_DIR, "job_matches.jsonl")
+    PARQUET_OUTPUT = os.path.join(OUTPUT_DIR, "job_matches.parquet")
+    OUTPUT_FORMATS = ['csv', 'jsonl']  # Any of: 'csv', 'jsonl', 'parquet'
     AUDIT_LOG = os.path.join(OUTPUT_DIR, "job_search_audit.log")
     
     TOP_MATCHES_DISPLAY = 30
     
+    # Cache scraped Glassdoor and Google Jobs pages so re-runs within the expiry skip the network
+    HTTP_CACHE = False
+    HTTP_CACHE_EXPIRE = 3600  # seconds
+    HTTP_CACHE_DIR = OUTPUT_DIR  # Shared by every run; the web app's per-search OUTPUT_DIR does not move it
+    
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     
     # LinkedIn scraper options
@@ -28,41 +45,41 @@ class Config:
     # Job matching algorithm
     MATCHER_TYPE = 'description_focused'  # Options: 'standard', 'enhanced', 'description_focused'
     
-    PLATFORMS = {
-        "linkedin": {
-            "enabled": True,
-            "base_url": "https://www.linkedin.com/jobs/search",
-            "search_params": {
+    PLATFORMS = MappingProxyType({
+        "linkedin": PlatformConfig(
+            enabled=True,
+            base_url="https://www.linkedin.com/jobs/search",
+            search_params=MappingProxyType({
                 "location": "Warsaw, Poland",
                 "f_TPR": "r604800"
-            }
-        },
-        "glassdoor": {
-            "enabled": True,
-            "base_url": "https://www.glassdoor.com/Job",
-            "search_params": {
+            })
+        ),
+        "glassdoor": PlatformConfig(
+            enabled=True,
+            base_url="https://www.glassdoor.com/Job",
+            search_params=MappingProxyType({
                 "locId": "2105",
                 "fromAge": "14"
-            }
-        },
-        "pracuj": {
-            "enabled": True,
-            "base_url": "https://www.pracuj.pl/praca",
-            "search_params": {
+            })
+        ),
+        "pracuj": PlatformConfig(
+            enabled=True,
+            base_url="https://www.pracuj.pl/praca",
+            search_params=MappingProxyType({
                 "et": "1,17",
                 "di": "14"
-            }
-        },
-        "google_jobs": {
-            "enabled": True,
-            "base_url": "https://www.google.com/search",
-            "search_params": {
+            })
+        ),
+        "google_jobs": PlatformConfig(
+            enabled=True,
+            base_url="https://www.google.com/search",
+            search_params=MappingProxyType({
                 "q": "jobs",
                 "ibp": "htl;jobs",
                 "chips": "date_posted:week"
-            }
-        }
-    }
+            })
+        )
+    })
     
     JOB_SEARCH_KEYWORDS = [
         "mechanical engineer",
@@ -4,6 +4,11 @@ import logging
 import sys
 import os
 import argparse
+import hashlib
+import importlib
+import threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -13,16 +18,6 @@ from utils.translator import JobTranslator
 from matchers.job_matcher import JobMatcher
 from matchers.enhanced_job_matcher import EnhancedJobMatcher
 from matchers.description_focused_matcher import DescriptionFocusedMatcher
-from scrapers.linkedin_scraper import LinkedInScraper
-from scrapers.linkedin_luminati_scraper import LinkedInLuminatiScraper
-from scrapers.glassdoor_scraper import GlassdoorScraper
-from scrapers.pracuj_scraper import PracujScraper
-from scrapers.google_jobs_scraper import GoogleJobsScraper
-from scrapers.indeed_scraper import IndeedScraper
-from scrapers.monster_scraper import MonsterScraper
-from scrapers.careerbuilder_scraper import CareerBuilderScraper
-from scrapers.nofluffjobs_scraper import NoFluffJobsScraper
-from scrapers.justjoinit_scraper import JustJoinITScraper
 from outputs.output_manager import OutputManager
 
 logging.basicConfig(
@@ -36,6 +31,31 @@ logging.basicConfig(
 
 logger = logging.getLogger('JobSearchAutomation')
 
+# Platform name -> (module, class); scraper modules are only imported for enabled platforms
+_SCRAPER_REGISTRY = {
+    'LinkedIn': ('scrapers.linkedin_luminati_scraper', 'LinkedInLuminatiScraper'),
+    'Glassdoor': ('scrapers.glassdoor_scraper', 'GlassdoorScraper'),
+    'Pracuj.pl': ('scrapers.pracuj_scraper', 'PracujScraper'),
+    'Google Jobs': ('scrapers.google_jobs_scraper', 'GoogleJobsScraper'),
+    'Indeed': ('scrapers.indeed_scraper', 'IndeedScraper'),
+    'Monster': ('scrapers.monster_scraper', 'MonsterScraper'),
+    'CareerBuilder': ('scrapers.careerbuilder_scraper', 'CareerBuilderScraper'),
+    'NoFluffJobs': ('scrapers.nofluffjobs_scraper', 'NoFluffJobsScraper'),
+    'JustJoinIT': ('scrapers.justjoinit_scraper', 'JustJoinITScraper')
+}
+
+_BASIC_LINKEDIN_SCRAPER = ('scrapers.linkedin_scraper', 'LinkedInScraper')
+
+def _load_scraper_class(module_name: str, class_name: str):
+    return getattr(importlib.import_module(module_name), class_name)
+
+def _job_key(job: dict) -> bytes:
+    """8-byte digest of company and title; NUL separates them so no two pairs collide by concatenation"""
+    return hashlib.blake2b(
+        f"{job.get('company', '')}\x00{job.get('job_title', '')}".encode('utf-8', 'replace'),
+        digest_size=8
+    ).digest()
+
 class JobSearchAutomation:
     def __init__(self, config: Config):
         self.config = config
@@ -43,6 +63,8 @@ class JobSearchAutomation:
         self.resume_parser = ResumeParser(config.RESUME_FILE)
         self.resume_profile = self.resume_parser.extract_profile()
         self.translator = JobTranslator()
+        # Platforms are searched concurrently; JobTranslator's client and cache are not thread-safe
+        self._translate_lock = threading.Lock()
         
         # Choose matching algorithm based on configuration
         matcher_type = getattr(config, 'MATCHER_TYPE', 'description_focused')
@@ -74,24 +96,33 @@ class JobSearchAutomation:
             logger.info("Using Standard Job Matcher")
         
         # Use enhanced LinkedIn scraper as primary, with fallback option
+        registry = dict(_SCRAPER_REGISTRY)
         if getattr(config, 'USE_BASIC_LINKEDIN', False):
-            linkedin_scraper = LinkedInScraper()
+            registry['LinkedIn'] = _BASIC_LINKEDIN_SCRAPER
             logger.info("Using basic LinkedIn scraper")
         else:
-            linkedin_scraper = LinkedInLuminatiScraper()
             logger.info("Using enhanced LinkedIn scraper (Luminati-based)")
         
-        self.scrapers = {
-            'LinkedIn': linkedin_scraper,
-            'Glassdoor': GlassdoorScraper(),
-            'Pracuj.pl': PracujScraper(),
-            'Google Jobs': GoogleJobsScraper(),
-            'Indeed': IndeedScraper(),
-            'Monster': MonsterScraper(),
-            'CareerBuilder': CareerBuilderScraper(),
-            'NoFluffJobs': NoFluffJobsScraper(),
-            'JustJoinIT': JustJoinITScraper()
+        # Cache databases live in one shared directory rather than in the working directory
+        cache_kwargs = {
+            'http_cache': getattr(config, 'HTTP_CACHE', False),
+            'cache_expire': getattr(config, 'HTTP_CACHE_EXPIRE', 3600),
+            'cache_dir': getattr(config, 'HTTP_CACHE_DIR', config.OUTPUT_DIR)
         }
+        scraper_kwargs = {
+            'Glassdoor': cache_kwargs,
+            'Google Jobs': cache_kwargs
+        }
+        
+        # Disabled platforms are never imported or constructed
+        self.scrapers = {}
+        for platform_name, (module_name, class_name) in registry.items():
+            platform = config.PLATFORMS.get(platform_name.lower().replace(' ', '_').replace('.', ''))
+            if platform is not None and not platform.enabled:
+                logger.info(f"Skipping {platform_name} (disabled)")
+                continue
+            scraper_class = _load_scraper_class(module_name, class_name)
+            self.scrapers[platform_name] = scraper_class(**scraper_kwargs.get(platform_name, {}))
         
         logger.info("Job Search Automation initialized")
         logger.info(f"Resume: {self.resume_profile['name']}")
@@ -99,7 +130,7 @@ class JobSearchAutomation:
         logger.info(f"Skills found: {len(self.resume_profile['skills'])}")
         logger.info(f"Minimum match threshold: {config.MIN_MATCH_PCT}%")
     
-    def search_platform(self, platform_name: str, scraper) -> tuple:
+    def search_platform(self, platform_name: str, scraper, cancel_event=None) -> tuple:
         logger.info(f"Searching {platform_name} for location: {self.config.SEARCH_LOCATION}")
         self.output_manager.write_audit_log(f"Starting search on {platform_name} - Location: {self.config.SEARCH_LOCATION}")
         
@@ -110,7 +141,8 @@ class JobSearchAutomation:
             raw_jobs = scraper.search_jobs(
                 keywords=self.config.JOB_SEARCH_KEYWORDS,
                 location=self.config.SEARCH_LOCATION,
-                include_remote=self.config.INCLUDE_REMOTE
+                include_remote=self.config.INCLUDE_REMOTE,
+                cancel_event=cancel_event
             )
             fetched_jobs = raw_jobs
             logger.info(f"{platform_name}: Fetched {len(fetched_jobs)} jobs")
@@ -119,20 +151,45 @@ class JobSearchAutomation:
             logger.error(error_msg)
             errors.append(error_msg)
         
-        matched_jobs = []
+        prepared_jobs = []
+        
+        # The standard matcher takes one cutoff for the whole batch instead of one per job
+        recency_kwargs = {}
+        if isinstance(self.job_matcher, JobMatcher):
+            recency_kwargs['cutoff_date'] = datetime.now() - timedelta(days=self.config.MAX_JOB_AGE_DAYS)
         
         for job in fetched_jobs:
+            if cancel_event is not None and cancel_event.is_set():
+                break
             try:
-                if not self.job_matcher.is_job_recent(job.get('posted_date', ''), self.config.MAX_JOB_AGE_DAYS):
+                if not self.job_matcher.is_job_recent(job.get('posted_date', ''), self.config.MAX_JOB_AGE_DAYS, **recency_kwargs):
                     continue
                 
                 # Translate job if needed (before matching)
-                job = self.translator.translate_job(job)
+                with self._translate_lock:
+                    job = self.translator.translate_job(job)
                 
                 job['required_experience'] = self.job_matcher.extract_experience_requirement(
                     job.get('description', '')
                 )
-                
+                prepared_jobs.append(job)
+            except Exception as e:
+                logger.warning(f"Error processing job from {platform_name}: {str(e)}")
+        
+        # The standard matcher scores the whole platform batch at once
+        standard_scores = None
+        if isinstance(self.job_matcher, JobMatcher):
+            try:
+                standard_scores = self.job_matcher.score_jobs(prepared_jobs)
+            except Exception as e:
+                logger.warning(f"Batch scoring failed for {platform_name}, scoring jobs one by one: {str(e)}")
+        
+        matched_jobs = []
+        
+        for index, job in enumerate(prepared_jobs):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            try:
                 # Use appropriate matching based on matcher type
                 if isinstance(self.job_matcher, DescriptionFocusedMatcher):
                     match_score, details = self.job_matcher.calculate_match_score(job)
@@ -150,6 +207,9 @@ class JobSearchAutomation:
                     # Add enhanced details to job
                     job['match_details'] = details
                     job['matched_keywords'] = matching_skills  # Use skills as keywords for enhanced matcher
+                elif standard_scores is not None:
+                    match_score, matching_skills = standard_scores[index]
+                    job['matched_keywords'] = list(matching_skills) if matching_skills else []
                 else:
                     match_score, matching_skills = self.job_matcher.calculate_match_score(job)
                     job['matched_keywords'] = list(matching_skills) if matching_skills else []
@@ -173,7 +233,8 @@ class JobSearchAutomation:
         
         return matched_jobs, len(fetched_jobs), len(matched_jobs)
     
-    def run(self):
+    def run(self, cancel_event=None):
+        """Run all enabled platforms; setting cancel_event stops scrapers before their next request and scoring after the current job"""
         logger.info("="*60)
         logger.info("STARTING JOB SEARCH AUTOMATION")
         logger.info(f"Timezone: {self.config.TIMEZONE}")
@@ -183,34 +244,50 @@ class JobSearchAutomation:
         
         self.output_manager.write_audit_log("Job search started")
         
-        all_matched_jobs = []
+        # First occurrence of each company/title wins; dicts keep insertion order.
+        # Jobs are folded in per platform so no combined list is ever built
+        jobs_by_key = {}
         platform_stats = {}
         
-        for platform_name, scraper in self.scrapers.items():
-            if self.config.PLATFORMS.get(platform_name.lower().replace(' ', '_').replace('.', ''), {}).get('enabled', True):
-                matched_jobs, fetched, kept = self.search_platform(platform_name, scraper)
-                all_matched_jobs.extend(matched_jobs)
-                platform_stats[platform_name] = {
-                    'fetched': fetched,
-                    'kept': kept
-                }
-            else:
-                logger.info(f"Skipping {platform_name} (disabled)")
+        enabled_scrapers = dict(self.scrapers)
         
-        seen_jobs = set()
-        unique_jobs = []
-        for job in all_matched_jobs:
-            job_key = f"{job.get('company', '')}_{job.get('job_title', '')}"
-            if job_key not in seen_jobs:
-                seen_jobs.add(job_key)
-                unique_jobs.append(job)
+        if cancel_event is not None and cancel_event.is_set():
+            logger.info("Job search cancelled, skipping all platforms")
+            enabled_scrapers = {}
+        
+        # Platforms are independent and I/O bound, so search them concurrently;
+        # results are collected in scraper order to keep de-duplication stable
+        if enabled_scrapers:
+            with ThreadPoolExecutor(max_workers=len(enabled_scrapers)) as executor:
+                futures = {
+                    platform_name: executor.submit(self.search_platform, platform_name, scraper, cancel_event)
+                    for platform_name, scraper in enabled_scrapers.items()
+                }
+                
+                for platform_name, future in futures.items():
+                    try:
+                        matched_jobs, fetched, kept = future.result()
+                    except Exception as e:
+                        logger.error(f"Error searching {platform_name}: {str(e)}")
+                        continue
+                    for job in matched_jobs:
+                        jobs_by_key.setdefault(_job_key(job), job)
+                    platform_stats[platform_name] = {
+                        'fetched': fetched,
+                        'kept': kept
+                    }
         
-        unique_jobs.sort(key=lambda x: x.get('match_score', 0), reverse=True)
+        unique_jobs = sorted(jobs_by_key.values(), key=lambda x: x.get('match_score', 0), reverse=True)
         
         logger.info(f"\nTotal unique matched jobs: {len(unique_jobs)}")
         
-        self.output_manager.save_to_csv(unique_jobs)
-        self.output_manager.save_to_jsonl(unique_jobs)
+        output_formats = getattr(self.config, 'OUTPUT_FORMATS', ['csv', 'jsonl'])
+        if 'csv' in output_formats:
+            self.output_manager.save_to_csv(unique_jobs)
+        if 'jsonl' in output_formats:
+            self.output_manager.save_to_jsonl(unique_jobs)
+        if 'parquet' in output_formats:
+            self.output_manager.save_to_parquet(unique_jobs)
         
         self.output_manager.print_summary(unique_jobs, platform_stats)
         
@@ -232,6 +309,7 @@ def main():
     parser.add_argument('--radius', type=int, default=100, help='Search radius in km')
     parser.add_argument('--no-remote', action='store_true', help='Exclude remote jobs from search')
     parser.add_argument('--linkedin-basic', action='store_true', help='Use basic LinkedIn scraper instead of enhanced Luminati approach')
+    parser.add_argument('--format', nargs='+', choices=['csv', 'jsonl', 'parquet'], default=['csv', 'jsonl'], help='Output file formats to write')
     
     args = parser.parse_args()
     
@@ -248,12 +326,14 @@ def main():
         config.OUTPUT_DIR = args.output_dir
         config.CSV_OUTPUT = os.path.join(args.output_dir, "job_matches.csv")
         config.JSONL_OUTPUT = os.path.join(args.output_dir, "job_matches.jsonl")
+        config.PARQUET_OUTPUT = os.path.join(args.output_dir, "job_matches.parquet")
         config.AUDIT_LOG = os.path.join(args.output_dir, "job_search_audit.log")
     
     # Location settings
     config.SEARCH_LOCATION = args.location
     config.SEARCH_RADIUS_KM = args.radius
     config.INCLUDE_REMOTE = not args.no_remote
+    config.OUTPUT_FORMATS = args.format
     
     # Scraper settings
     config.USE_BASIC_LINKEDIN = args.linkedin_basic
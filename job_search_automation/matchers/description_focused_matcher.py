@@ -22,10 +22,10 @@ from datetime import datetime, timedelta
 import re
 from typing import Dict, List, Set, Tuple
 from datetime import datetime, timedelta
-import nltk
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+from utils.nltk_resources import ensure_nltk_resources
 from collections import Counter
 
 class DescriptionFocusedMatcher:
@@ -48,8 +48,7 @@ class DescriptionFocusedMatcher:
         
         # Download NLTK data
         try:
-            nltk.download('stopwords', quiet=True)
-            nltk.download('punkt', quiet=True)
+            ensure_nltk_resources()
             from nltk.corpus import stopwords
             from nltk.tokenize import word_tokenize
             self.stop_words = set(stopwords.words('english'))
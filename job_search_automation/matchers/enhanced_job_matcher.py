@@ -14,10 +14,10 @@ Key Features:
 import re
 from typing import Dict, List, Set, Tuple
 from datetime import datetime, timedelta
-import nltk
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
+from utils.nltk_resources import ensure_nltk_resources
 
 class EnhancedJobMatcher:
     def __init__(self, resume_profile: Dict, user_skills: List[str] = None, user_experience: int = 0):
@@ -43,8 +43,7 @@ class EnhancedJobMatcher:
         self.all_skills = self.resume_skills.union(self.user_skills)
         
         try:
-            nltk.download('stopwords', quiet=True)
-            nltk.download('punkt', quiet=True)
+            ensure_nltk_resources()
             from nltk.corpus import stopwords
             self.stop_words = set(stopwords.words('english'))
         except:
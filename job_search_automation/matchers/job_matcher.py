@@ -1,51 +1,114 @@
 import re
+import itertools
 from typing import Dict, List, Set, Tuple
 from datetime import datetime, timedelta
-import nltk
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+
+# sklearn, numpy and nltk are slow to import; load them on first use and keep them here
+_TfidfVectorizer = None
+_linear_kernel = None
+_np = None
+
+def _load_sklearn():
+    global _TfidfVectorizer, _linear_kernel
+    if _TfidfVectorizer is None:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import linear_kernel
+        _linear_kernel = linear_kernel
+        _TfidfVectorizer = TfidfVectorizer
+    return _TfidfVectorizer, _linear_kernel
+
+def _load_numpy():
+    global _np
+    if _np is None:
+        import numpy
+        _np = numpy
+    return _np
+
+_COMMON_SKILLS = frozenset([
+    "python", "java", "javascript", "c++", "sql", "matlab", "r",
+    "autocad", "revit", "solidworks", "ansys", "catia", "inventor",
+    "excel", "vba", "powerpoint", "word", "project",
+    "sap", "oracle", "salesforce", "crm",
+    "machine learning", "deep learning", "data analysis", "statistics",
+    "cfd", "fea", "fem", "cad", "cam", "plc", "scada",
+    "hvac", "thermal", "mechanical", "electrical", "renewable",
+    "lean", "six sigma", "agile", "scrum", "project management",
+    "leadership", "communication", "teamwork", "problem solving"
+])
+# One bit per common skill, so a job's common skills fit in a single int
+_SKILL_BITS = {skill: 1 << bit for bit, skill in enumerate(sorted(_COMMON_SKILLS))}
+
+_SKILL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\b(?:proficient|experienced|knowledge|skills?)\s+(?:in|with)\s+([^,.;]+)',
+    r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:experience|knowledge|skills?)',
+    r'(?:technologies|tools|software):\s*([^.;]+)'
+)]
+
+# Experience phrasings in priority order, scanned in one pass. Each one sits in
+# its own lookahead so lastindex tells which phrasing matched at a position.
+# (A "3-5 years experience" range always also matches the first phrasing.)
+_EXP_UNION = re.compile('|'.join('(?=' + p + ')' for p in (
+    r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
+    r'minimum\s*(\d+)\s*years?',
+    r'at\s*least\s*(\d+)\s*years?',
+    r'(\d+)\s*years?\s*minimum'
+)), re.IGNORECASE)
+
+# Component weights, in the column order used by score_jobs
+_SCORE_WEIGHTS = {
+    'keyword': 0.25,
+    'title': 0.20,
+    'experience': 0.15,
+    'skills': 0.25,
+    'tfidf': 0.15
+}
+
+_DAYS_RE = re.compile(r'(\d+)\s*days?', re.IGNORECASE)
+_WEEKS_RE = re.compile(r'(\d+)\s*weeks?', re.IGNORECASE)
 
 class JobMatcher:
     def __init__(self, resume_profile: Dict):
         self.resume_profile = resume_profile
-        self.resume_keywords = resume_profile.get('keywords', set())
-        self.resume_skills = set([s.lower() for s in resume_profile.get('skills', [])])
+        self.resume_keywords = frozenset(resume_profile.get('keywords', ()))
+        self.resume_skills = frozenset(s.lower() for s in resume_profile.get('skills', []))
         self.resume_experience = resume_profile.get('experience_years', 0)
-        self.target_roles = [r.lower() for r in resume_profile.get('target_roles', [])]
+        self.target_roles = tuple(r.lower() for r in resume_profile.get('target_roles', []))
+        
+        # Resume-side inputs are fixed for the matcher's lifetime, so build them once
+        self._resume_text = ' '.join(itertools.chain(self.resume_keywords, self.resume_skills, self.target_roles))
+        self._target_role_words = [(role, set(role.split())) for role in self.target_roles]
+        # For each resume skill, the common skills it matches (either is a substring of the other)
+        self._resume_skill_masks = [
+            (skill, sum(bit for common, bit in _SKILL_BITS.items() if skill in common or common in skill))
+            for skill in self.resume_skills
+        ]
+        # Cross-posted jobs show up on several platforms; score each one only once.
+        # Plain dict reads/writes are atomic, so concurrent platform searches can share it
+        self._score_cache = {}
+        # Keywords and common skills overlap; each description is checked once per distinct term
+        self._scan_vocabulary = tuple(self.resume_keywords | _COMMON_SKILLS)
         
         try:
-            nltk.download('stopwords', quiet=True)
-            nltk.download('punkt', quiet=True)
+            from utils.nltk_resources import ensure_nltk_resources
+            ensure_nltk_resources()
             from nltk.corpus import stopwords
             self.stop_words = set(stopwords.words('english'))
         except:
             self.stop_words = set()
     
     def calculate_match_score(self, job: Dict) -> Tuple[float, List[str]]:
-        job_title = job.get('job_title', '').lower()
-        job_description = job.get('description', '').lower()
-        required_experience = job.get('required_experience', 0)
-        job_skills = self._extract_job_skills(job_description)
+        cache_key = self._score_cache_key(job)
+        cached = self._score_cache.get(cache_key)
+        if cached is not None:
+            return cached[0], list(cached[1])
         
-        keyword_score = self._calculate_keyword_match(job_description)
+        keyword_score, title_score, skill_score, skill_matches = self._score_components(job)
         
-        title_score = self._calculate_title_match(job_title)
-        
-        experience_score = self._calculate_experience_match(required_experience)
-        
-        skill_matches = self._find_skill_matches(job_skills)
-        skill_score = len(skill_matches) / max(len(self.resume_skills), 1) * 100
+        experience_score = self._calculate_experience_match(job.get('required_experience', 0))
         
-        tfidf_score = self._calculate_tfidf_similarity(job_description)
+        tfidf_score = self._calculate_tfidf_similarity(job.get('description', '').lower())
         
-        weights = {
-            'keyword': 0.25,
-            'title': 0.20,
-            'experience': 0.15,
-            'skills': 0.25,
-            'tfidf': 0.15
-        }
+        weights = _SCORE_WEIGHTS
         
         final_score = (
             keyword_score * weights['keyword'] +
@@ -55,16 +118,86 @@ class JobMatcher:
             tfidf_score * weights['tfidf']
         )
         
-        return min(100, final_score), skill_matches
+        result = (min(100, final_score), skill_matches)
+        self._score_cache[cache_key] = result
+        return result[0], list(skill_matches)
+    
+    def score_jobs(self, jobs: List[Dict]) -> List[Tuple[float, List[str]]]:
+        """
+        Score a batch of jobs, same results as calculate_match_score per job.
+        Jobs already scored, e.g. cross-posted on a platform scored earlier,
+        keep their cached score. The weighted sum of all components is a
+        single array product
+        """
+        if not jobs:
+            return []
+        
+        results = [None] * len(jobs)
+        pending = []
+        for index, job in enumerate(jobs):
+            cached = self._score_cache.get(self._score_cache_key(job))
+            if cached is not None:
+                results[index] = (cached[0], list(cached[1]))
+            else:
+                pending.append(index)
+        
+        if not pending:
+            return results
+        
+        np = _load_numpy()
+        components = np.empty((len(pending), len(_SCORE_WEIGHTS)))
+        required_experience = np.empty(len(pending))
+        skill_lists = []
+        for row, index in enumerate(pending):
+            keyword_score, title_score, skill_score, skill_matches = self._score_components(jobs[index])
+            tfidf_score = self._calculate_tfidf_similarity(jobs[index].get('description', '').lower())
+            components[row] = (keyword_score, title_score, 0, skill_score, tfidf_score)
+            required_experience[row] = jobs[index].get('required_experience', 0)
+            skill_lists.append(skill_matches)
+        
+        # Experience is the third column; its piecewise ladder is filled in for the whole batch at once
+        components[:, 2] = self._experience_scores(required_experience)
+        
+        weights = np.fromiter(_SCORE_WEIGHTS.values(), dtype=float, count=len(_SCORE_WEIGHTS))
+        final_scores = np.minimum(components @ weights, 100)
+        
+        for index, final_score, skill_matches in zip(pending, final_scores.tolist(), skill_lists):
+            self._score_cache[self._score_cache_key(jobs[index])] = (final_score, skill_matches)
+            results[index] = (final_score, list(skill_matches))
+        
+        return results
     
-    def _calculate_keyword_match(self, job_description: str) -> float:
+    @staticmethod
+    def _score_cache_key(job: Dict) -> tuple:
+        return (job.get('company', ''), job.get('job_title', ''), job.get('description', ''))
+    
+    def _score_components(self, job: Dict) -> tuple:
+        """Keyword, title and skill scores plus the matched skills"""
+        job_title = job.get('job_title', '').lower()
+        job_description = job.get('description', '').lower()
+        found_terms = self._scan_terms(job_description)
+        skill_mask, skill_phrases = self._extract_job_skills(job_description, found_terms)
+        
+        keyword_score = self._calculate_keyword_match(job_description, found_terms)
+        
+        title_score = self._calculate_title_match(job_title)
+        
+        skill_matches = self._find_skill_matches(skill_mask, skill_phrases)
+        skill_score = len(skill_matches) / max(len(self.resume_skills), 1) * 100
+        
+        return keyword_score, title_score, skill_score, skill_matches
+    
+    def _scan_terms(self, job_description: str) -> Set[str]:
+        """All resume keywords and common skills occurring in the lowercased description"""
+        return {term for term in self._scan_vocabulary if term in job_description}
+    
+    def _calculate_keyword_match(self, job_description: str, found_terms: Set[str] = None) -> float:
         if not self.resume_keywords:
             return 0
         
-        matches = 0
-        for keyword in self.resume_keywords:
-            if keyword in job_description:
-                matches += 1
+        if found_terms is None:
+            found_terms = self._scan_terms(job_description)
+        matches = len(found_terms.intersection(self.resume_keywords))
         
         return (matches / len(self.resume_keywords)) * 100
     
@@ -73,10 +206,8 @@ class JobMatcher:
             return 0
         
         max_score = 0
-        for target_role in self.target_roles:
-            role_words = set(target_role.split())
-            title_words = set(job_title.split())
-            
+        title_words = set(job_title.split())
+        for target_role, role_words in self._target_role_words:
             if role_words & title_words:
                 overlap = len(role_words & title_words) / len(role_words)
                 max_score = max(max_score, overlap * 100)
@@ -101,120 +232,120 @@ class JobMatcher:
         else:
             return max(0, 40 - abs(experience_diff) * 10)
     
-    def _extract_job_skills(self, job_description: str) -> Set[str]:
-        skills = set()
-        
-        common_skills = [
-            "python", "java", "javascript", "c++", "sql", "matlab", "r",
-            "autocad", "revit", "solidworks", "ansys", "catia", "inventor",
-            "excel", "vba", "powerpoint", "word", "project",
-            "sap", "oracle", "salesforce", "crm",
-            "machine learning", "deep learning", "data analysis", "statistics",
-            "cfd", "fea", "fem", "cad", "cam", "plc", "scada",
-            "hvac", "thermal", "mechanical", "electrical", "renewable",
-            "lean", "six sigma", "agile", "scrum", "project management",
-            "leadership", "communication", "teamwork", "problem solving"
-        ]
-        
-        for skill in common_skills:
-            if skill in job_description:
-                skills.add(skill)
+    def _experience_scores(self, required_experience):
+        """_calculate_experience_match over a whole array of requirements"""
+        np = _load_numpy()
+        experience_diff = self.resume_experience - required_experience
         
-        skill_patterns = [
-            r'\b(?:proficient|experienced|knowledge|skills?)\s+(?:in|with)\s+([^,.;]+)',
-            r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(?:experience|knowledge|skills?)',
-            r'(?:technologies|tools|software):\s*([^.;]+)'
-        ]
+        return np.select(
+            [required_experience == 0, experience_diff >= 0, experience_diff >= -1, experience_diff >= -2],
+            [100.0, 100.0, 80.0, 60.0],
+            default=np.maximum(0.0, 40.0 - np.abs(experience_diff) * 10.0)
+        )
+    
+    def _extract_job_skills(self, job_description: str, found_terms: Set[str] = None) -> Tuple[int, Set[str]]:
+        """Common skills in the description as a _SKILL_BITS mask, plus free-text skill phrases"""
+        if found_terms is None:
+            found_terms = self._scan_terms(job_description)
+        skill_mask = 0
+        for skill in found_terms.intersection(_COMMON_SKILLS):
+            skill_mask |= _SKILL_BITS[skill]
         
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
-            for match in matches:
-                extracted = match.strip().lower()
+        skill_phrases = set()
+        for pattern in _SKILL_PATTERNS:
+            for match in pattern.finditer(job_description):
+                extracted = match.group(1).strip().lower()
                 if len(extracted) < 30:
-                    skills.add(extracted)
+                    skill_phrases.add(extracted)
         
-        return skills
+        return skill_mask, skill_phrases
     
-    def _find_skill_matches(self, job_skills: Set[str]) -> List[str]:
-        matches = []
+    def _find_skill_matches(self, skill_mask: int, skill_phrases: Set[str]) -> List[str]:
+        matches = {skill for skill, related in self._resume_skill_masks if skill_mask & related}
+        remaining = self.resume_skills - matches
         
-        for resume_skill in self.resume_skills:
-            for job_skill in job_skills:
-                if resume_skill in job_skill or job_skill in resume_skill:
-                    matches.append(resume_skill)
-                    break
+        if remaining and skill_phrases:
+            matches |= remaining & skill_phrases
+            remaining -= matches
+            # Skills never contain NUL, so a hit in the joined string lies within one phrase
+            joined = '\x00'.join(skill_phrases)
+            matches |= {
+                skill for skill in remaining
+                if skill in joined or any(phrase in skill for phrase in skill_phrases)
+            }
         
-        return list(set(matches))
+        return list(matches)
     
     def _calculate_tfidf_similarity(self, job_description: str) -> float:
         try:
-            resume_text = ' '.join([
-                ' '.join(self.resume_keywords),
-                ' '.join(self.resume_skills),
-                ' '.join(self.target_roles)
-            ])
+            resume_text = self._resume_text
             
             if not resume_text.strip() or not job_description.strip():
                 return 0
             
+            # Fitted on the resume and this one job only, so the score does not depend on other jobs
+            TfidfVectorizer, linear_kernel = _load_sklearn()
             vectorizer = TfidfVectorizer(stop_words='english', max_features=100)
             tfidf_matrix = vectorizer.fit_transform([resume_text, job_description])
             
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            # TF-IDF rows are L2-normalised, so the sparse dot product is the cosine
+            similarity = linear_kernel(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
             
             return similarity * 100
         except:
             return 0
     
     def extract_experience_requirement(self, job_description: str) -> float:
-        experience_patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?experience',
-            r'(\d+)\s*-\s*(\d+)\s*years?\s*(?:of\s*)?experience',
-            r'minimum\s*(\d+)\s*years?',
-            r'at\s*least\s*(\d+)\s*years?',
-            r'(\d+)\s*years?\s*minimum'
-        ]
-        
-        for pattern in experience_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
-            if matches:
-                if isinstance(matches[0], tuple):
-                    return float(matches[0][0])
-                else:
-                    return float(matches[0])
+        # Earliest occurrence of the highest-priority phrasing present
+        best = None
+        for match in _EXP_UNION.finditer(job_description):
+            if best is None or match.lastindex < best.lastindex:
+                best = match
+                if best.lastindex == 1:
+                    break
+        if best is not None:
+            return float(best.group(best.lastindex))
         
-        if any(term in job_description.lower() for term in ['entry level', 'junior', 'graduate', 'intern']):
+        description = job_description.lower()
+        if any(term in description for term in ['entry level', 'junior', 'graduate', 'intern']):
             return 0
-        elif any(term in job_description.lower() for term in ['senior', 'lead', 'principal']):
+        elif any(term in description for term in ['senior', 'lead', 'principal']):
             return 5
-        elif any(term in job_description.lower() for term in ['mid-level', 'intermediate']):
+        elif any(term in description for term in ['mid-level', 'intermediate']):
             return 3
         
         return 0
     
-    def is_job_recent(self, posted_date: str, max_days: int = 14) -> bool:
+    def is_job_recent(self, posted_date: str, max_days: int = 14, cutoff_date: datetime = None) -> bool:
         try:
-            if "today" in posted_date.lower() or "just now" in posted_date.lower():
+            date_text = posted_date.lower()
+            if "today" in date_text or "just now" in date_text:
                 return True
-            elif "yesterday" in posted_date.lower():
+            elif "yesterday" in date_text:
                 return True
-            elif "day" in posted_date.lower():
-                days_match = re.search(r'(\d+)\s*days?', posted_date, re.IGNORECASE)
+            elif "day" in date_text:
+                days_match = _DAYS_RE.search(date_text)
                 if days_match:
                     days_ago = int(days_match.group(1))
                     return days_ago <= max_days
-            elif "week" in posted_date.lower():
-                weeks_match = re.search(r'(\d+)\s*weeks?', posted_date, re.IGNORECASE)
+            elif "week" in date_text:
+                weeks_match = _WEEKS_RE.search(date_text)
                 if weeks_match:
                     weeks_ago = int(weeks_match.group(1))
                     return weeks_ago * 7 <= max_days
                 return True
-            elif "month" in posted_date.lower():
+            elif "month" in date_text:
                 return False
             
-            from dateutil import parser
-            job_date = parser.parse(posted_date)
-            cutoff_date = datetime.now() - timedelta(days=max_days)
+            # ISO dates are the common absolute format and parse in C; dateutil covers the rest
+            try:
+                job_date = datetime.fromisoformat(posted_date[:10])
+            except ValueError:
+                from dateutil import parser
+                job_date = parser.parse(posted_date)
+            
+            if cutoff_date is None:
+                cutoff_date = datetime.now() - timedelta(days=max_days)
             return job_date >= cutoff_date
         except:
             return True
\ No newline at end of file
@@ -2,6 +2,8 @@ import csv
 import json
 import jsonlines
 import os
+import heapq
+import threading
 from typing import List, Dict
 from datetime import datetime
 import logging
@@ -11,6 +13,7 @@ class OutputManager:
     def __init__(self, config):
         self.config = config
         self.logger = logging.getLogger('OutputManager')
+        self._audit_lock = threading.Lock()  # platforms are searched from worker threads
         self._ensure_output_dir()
     
     def _ensure_output_dir(self):
@@ -77,6 +80,39 @@ class OutputManager:
         except Exception as e:
             self.logger.error(f"Error saving to JSONL: {str(e)}")
     
+    def save_to_parquet(self, jobs: List[Dict], filename: str = None):
+        filename = filename or self.config.PARQUET_OUTPUT
+        
+        if not jobs:
+            self.logger.warning("No jobs to save to Parquet")
+            return
+        
+        try:
+            # pandas/pyarrow are only needed for this optional format
+            import pandas as pd
+            
+            scraped_at = datetime.now().isoformat()
+            df = pd.DataFrame([{
+                'match_score': job.get('match_score', 0),
+                'job_title': job.get('job_title', ''),
+                'company': job.get('company', ''),
+                'platform': job.get('platform', ''),
+                'location': job.get('location', ''),
+                'job_url': job.get('job_url', ''),
+                'posted_date': job.get('posted_date', ''),
+                'description': job.get('description', ''),
+                'matching_skills': list(job.get('matching_skills', [])),
+                'required_experience': job.get('required_experience', 0),
+                'salary': job.get('salary', ''),
+                'scraped_at': scraped_at
+            } for job in jobs])
+            df = df.astype({'platform': 'category', 'location': 'category', 'company': 'category'})
+            df.to_parquet(filename, engine='pyarrow', compression='snappy', index=False)
+            
+            self.logger.info(f"Saved {len(jobs)} jobs to Parquet: {filename}")
+        except Exception as e:
+            self.logger.error(f"Error saving to Parquet: {str(e)}")
+    
     def print_summary(self, jobs: List[Dict], platform_stats: Dict):
         print("\n" + "="*100)
         print("JOB SEARCH SUMMARY")
@@ -102,7 +138,7 @@ class OutputManager:
         print(tabulate(stats_table, headers=["Platform", "Fetched", "Kept", "Keep Rate"], tablefmt="grid"))
         
         if jobs:
-            top_jobs = sorted(jobs, key=lambda x: x.get('match_score', 0), reverse=True)[:self.config.TOP_MATCHES_DISPLAY]
+            top_jobs = heapq.nlargest(self.config.TOP_MATCHES_DISPLAY, jobs, key=lambda x: x.get('match_score', 0))
             
             print(f"\nTOP {min(len(top_jobs), self.config.TOP_MATCHES_DISPLAY)} MATCHES:")
             print("-"*100)
@@ -130,7 +166,7 @@ class OutputManager:
         timestamp = datetime.now().isoformat()
         
         try:
-            with open(self.config.AUDIT_LOG, 'a', encoding='utf-8') as f:
+            with self._audit_lock, open(self.config.AUDIT_LOG, 'a', encoding='utf-8') as f:
                 f.write(f"[{timestamp}] [{level}] {message}\n")
         except Exception as e:
             self.logger.error(f"Error writing to audit log: {str(e)}")
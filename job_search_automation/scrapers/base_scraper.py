@@ -1,18 +1,51 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Union
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import random
+import threading
 from fake_useragent import UserAgent
 import logging
+from functools import lru_cache
+
+try:
+    # orjson decodes large API payloads several times faster and accepts bytes directly
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+@lru_cache(maxsize=4096)
+def _clean_short_text(text: str) -> str:
+    return ' '.join(text.split())
 
 class BaseScraper(ABC):
     def __init__(self, platform_name: str):
         self.platform_name = platform_name
         self.ua = UserAgent()
-        self.session = requests.Session()
+        self.session = self._create_session()
         self.logger = logging.getLogger(platform_name)
+        # Send time of the latest request slot handed out by make_request
+        self._pace_lock = threading.Lock()
+        self._last_request_at = 0.0
+    
+    @staticmethod
+    def _create_session(session: requests.Session = None) -> requests.Session:
+        """Pooled keep-alive session; connection errors are retried with backoff"""
+        if session is None:
+            session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            # Only failed connects are retried: a read timeout already cost the full timeout,
+            # and callers such as LinkedIn's _make_robust_request run their own retry loop
+            max_retries=Retry(connect=3, read=0, backoff_factor=0.3)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
         
     def get_headers(self) -> Dict:
         return {
@@ -24,9 +57,16 @@ class BaseScraper(ABC):
             'Upgrade-Insecure-Requests': '1'
         }
     
+    def _pace(self):
+        """Wait 1-3 s after the previous request; concurrent callers queue behind each other's slots"""
+        with self._pace_lock:
+            send_at = max(time.time(), self._last_request_at) + random.uniform(1, 3)
+            self._last_request_at = send_at
+        time.sleep(max(0, send_at - time.time()))
+    
     def make_request(self, url: str, params: Dict = None) -> requests.Response:
         try:
-            time.sleep(random.uniform(1, 3))
+            self._pace()
             response = self.session.get(
                 url,
                 headers=self.get_headers(),
@@ -42,10 +82,22 @@ class BaseScraper(ABC):
     def parse_html(self, html: str) -> BeautifulSoup:
         return BeautifulSoup(html, 'html.parser')
     
+    def parse_html_filtered(self, html: Union[str, bytes], strainer: SoupStrainer) -> BeautifulSoup:
+        """
+        Parse only the tags matched by strainer (with their contents), skipping the rest of the page.
+        Raw response bytes can be passed as-is; the parser reads the page's declared charset itself
+        """
+        return BeautifulSoup(html, 'lxml', parse_only=strainer)
+    
     @abstractmethod
-    def search_jobs(self, keywords: List[str], location: str = None) -> List[Dict]:
+    def search_jobs(self, keywords: List[str], location: str = None, cancel_event=None) -> List[Dict]:
         pass
     
+    @staticmethod
+    def is_cancelled(cancel_event) -> bool:
+        """True once the caller has asked the running search to stop"""
+        return cancel_event is not None and cancel_event.is_set()
+    
     @abstractmethod
     def parse_job_listing(self, listing) -> Dict:
         pass
@@ -53,4 +105,7 @@ class BaseScraper(ABC):
     def clean_text(self, text: str) -> str:
         if not text:
             return ""
-        return ' '.join(text.strip().split())
\ No newline at end of file
+        # Company names and locations repeat across listings; descriptions rarely do
+        if len(text) <= 256:
+            return _clean_short_text(text)
+        return ' '.join(text.split())
\ No newline at end of file
@@ -18,11 +18,13 @@ class CareerBuilderScraper(BaseScraper):
         self.scraper = cloudscraper.create_scraper()
         self.logger = logging.getLogger('CareerBuilderScraper')
     
-    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True) -> List[Dict]:
+    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True, cancel_event=None) -> List[Dict]:
         """Search for jobs on CareerBuilder"""
         all_jobs = []
         
         for keyword in keywords:
+            if self.is_cancelled(cancel_event):
+                break
             try:
                 jobs = self._search_keyword(keyword, location, include_remote)
                 all_jobs.extend(jobs)
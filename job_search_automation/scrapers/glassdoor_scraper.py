@@ -1,58 +1,110 @@
 from typing import List, Dict
+import os
 import re
+import threading
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
 from .base_scraper import BaseScraper
 import cloudscraper
+from bs4 import BeautifulSoup
+
+_DAYS_RE = re.compile(r'(\d+)\s*d')
+
+# Location IDs for Polish cities
+_LOCATION_IDS = {
+    "poland": "2616",
+    "warsaw": "3089098",
+    "krakow": "3089171",
+    "wroclaw": "3089235",
+    "poznan": "3089197",
+    "gdansk": "3089093",
+    "lodz": "3089181",
+    "katowice": "3089154"
+}
+
+# requests-cache is optional; without it HTTP_CACHE is ignored for Glassdoor
+try:
+    from requests_cache import CacheMixin
+except ImportError:
+    CacheMixin = None
+    CachedCloudScraper = None
+else:
+    class CachedCloudScraper(CacheMixin, cloudscraper.CloudScraper):
+        """cloudscraper session whose GETs are served from a local SQLite cache when fresh"""
 
 class GlassdoorScraper(BaseScraper):
-    def __init__(self):
+    def __init__(self, http_cache: bool = False, cache_expire: int = 3600, cache_dir: str = '.'):
         super().__init__("Glassdoor")
-        self.scraper = cloudscraper.create_scraper()
-        # Location IDs for Polish cities
-        self.location_ids = {
-            "poland": "2616",
-            "warsaw": "3089098", 
-            "krakow": "3089171",
-            "wroclaw": "3089235",
-            "poznan": "3089197",
-            "gdansk": "3089093",
-            "lodz": "3089181",
-            "katowice": "3089154"
-        }
+        self.http_cache = http_cache
+        self.cache_expire = cache_expire
+        self.cache_name = os.path.join(cache_dir, 'glassdoor_cache')
+        if http_cache:
+            if CachedCloudScraper is None:
+                self.logger.warning("requests-cache is not installed, Glassdoor responses will not be cached")
+                self.http_cache = False
+            else:
+                os.makedirs(cache_dir, exist_ok=True)
+        self._local = threading.local()
+    
+    def parse_html(self, html: str) -> BeautifulSoup:
+        # Glassdoor result pages are large; lxml builds the tree several times faster
+        return BeautifulSoup(html, 'lxml')
+    
+    def _get_scraper(self):
+        """
+        This thread's cloudscraper. Each instance keeps its own Cloudflare
+        challenge state and cookies, so fetch workers never share one
+        """
+        scraper = getattr(self._local, 'scraper', None)
+        if scraper is None:
+            if self.http_cache:
+                scraper = CachedCloudScraper(
+                    cache_name=self.cache_name, backend='sqlite', expire_after=self.cache_expire
+                )
+            else:
+                scraper = cloudscraper.create_scraper()
+            self._local.scraper = scraper
+        return scraper
     
-    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True) -> List[Dict]:
-        all_jobs = []
+    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True, cancel_event=None) -> List[Dict]:
+        if not keywords:
+            return []
+        
+        urls = [self._build_url(keyword, location) for keyword in keywords]
+        
+        # Only the HTTP waits run in parallel; parsing stays on this thread
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+            responses = list(executor.map(lambda url: self._fetch(url, cancel_event), urls))
         
-        for keyword in keywords:
+        jobs_by_url = {}
+        for keyword, response in zip(keywords, responses):
             try:
-                jobs = self._search_keyword(keyword, location)
-                all_jobs.extend(jobs)
+                for job in self._parse_response(response):
+                    jobs_by_url.setdefault(job['job_url'], job)
             except Exception as e:
                 self.logger.error(f"Error searching Glassdoor for '{keyword}': {str(e)}")
         
-        seen_urls = set()
-        unique_jobs = []
-        for job in all_jobs:
-            if job['job_url'] not in seen_urls:
-                seen_urls.add(job['job_url'])
-                unique_jobs.append(job)
-        
-        return unique_jobs
+        return list(jobs_by_url.values())
     
-    def _get_location_id(self, location: str) -> str:
+    @staticmethod
+    def _get_location_id(location: str) -> str:
         """Get Glassdoor location ID for Polish locations"""
         location_lower = location.lower().replace(", poland", "").replace("poland", "").strip()
-        return self.location_ids.get(location_lower, self.location_ids["poland"])
+        return _LOCATION_IDS.get(location_lower, _LOCATION_IDS["poland"])
     
-    def _search_keyword(self, keyword: str, location: str) -> List[Dict]:
+    def _build_url(self, keyword: str, location: str) -> str:
         location_id = self._get_location_id(location)
         location_name = location.lower().replace(", poland", "").replace(" ", "-")
         
         # Build URL based on location
         if "poland" in location.lower():
-            search_url = f"https://www.glassdoor.com/Job/poland-{keyword.replace(' ', '-')}-jobs-SRCH_IL.0,6_IN193_KO7,30.htm"
-        else:
-            search_url = f"https://www.glassdoor.com/Job/{location_name}-{keyword.replace(' ', '-')}-jobs-SRCH_IL.0,{len(location_name)}_IC{location_id}_KO{len(location_name)+1},50.htm"
+            return f"https://www.glassdoor.com/Job/poland-{keyword.replace(' ', '-')}-jobs-SRCH_IL.0,6_IN193_KO7,30.htm"
+        return f"https://www.glassdoor.com/Job/{location_name}-{keyword.replace(' ', '-')}-jobs-SRCH_IL.0,{len(location_name)}_IC{location_id}_KO{len(location_name)+1},50.htm"
+    
+    def _fetch(self, search_url: str, cancel_event=None):
+        # Pages still queued when a stop is requested are skipped
+        if self.is_cancelled(cancel_event):
+            return None
         
         params = {
             'fromAge': '14',
@@ -60,47 +112,44 @@ class GlassdoorScraper(BaseScraper):
         }
         
         try:
-            response = self.scraper.get(search_url, params=params, timeout=30)
+            response = self._get_scraper().get(search_url, params=params, timeout=30)
             if response.status_code != 200:
-                return []
-            
-            soup = self.parse_html(response.text)
-            
-            job_listings = soup.find_all('li', {'class': 'react-job-listing'}) or \
-                          soup.find_all('div', {'class': 'jobContainer'}) or \
-                          soup.find_all('article', {'data-test': 'job-card'})
-            
-            jobs = []
-            for listing in job_listings[:50]:
-                job = self.parse_job_listing(listing)
-                if job:
-                    jobs.append(job)
-            
-            return jobs
+                return None
+            return response
         except Exception as e:
             self.logger.error(f"Error in Glassdoor search: {str(e)}")
+            return None
+    
+    def _parse_response(self, response) -> List[Dict]:
+        if response is None:
             return []
+        
+        soup = self.parse_html(response.text)
+        
+        job_listings = soup.find_all('li', {'class': 'react-job-listing'}) or \
+                      soup.find_all('div', {'class': 'jobContainer'}) or \
+                      soup.find_all('article', {'data-test': 'job-card'})
+        
+        jobs = []
+        for listing in job_listings[:50]:
+            job = self.parse_job_listing(listing)
+            if job:
+                jobs.append(job)
+        
+        return jobs
     
     def parse_job_listing(self, listing) -> Dict:
         try:
-            title_elem = listing.find('a', {'data-test': 'job-link'}) or \
-                        listing.find('a', class_='jobLink') or \
-                        listing.find('div', {'data-test': 'job-title'})
+            # One selector list per field: a single tree walk instead of a find() per fallback
+            title_elem = listing.select_one('a[data-test="job-link"], a.jobLink, div[data-test="job-title"]')
             
-            company_elem = listing.find('div', {'data-test': 'employer-name'}) or \
-                          listing.find('div', class_='e1n63ojh0') or \
-                          listing.find('span', class_='employer-name')
+            company_elem = listing.select_one('div[data-test="employer-name"], div.e1n63ojh0, span.employer-name')
             
-            location_elem = listing.find('div', {'data-test': 'employer-location'}) or \
-                           listing.find('span', {'data-test': 'job-location'}) or \
-                           listing.find('div', class_='location')
+            location_elem = listing.select_one('div[data-test="employer-location"], span[data-test="job-location"], div.location')
             
-            link_elem = listing.find('a', {'data-test': 'job-link'}) or \
-                       listing.find('a', class_='jobLink')
+            link_elem = listing.select_one('a[data-test="job-link"], a.jobLink')
             
-            posted_elem = listing.find('div', {'data-test': 'job-age'}) or \
-                         listing.find('span', class_='minor') or \
-                         listing.find('div', class_='d-flex align-items-end')
+            posted_elem = listing.select_one('div[data-test="job-age"], span.minor, div.d-flex.align-items-end')
             
             if not (title_elem and company_elem):
                 return None
@@ -136,8 +185,7 @@ class GlassdoorScraper(BaseScraper):
             return None
     
     def _extract_description(self, listing) -> str:
-        desc_elem = listing.find('div', class_='jobDescriptionContent') or \
-                   listing.find('div', {'data-test': 'job-snippet'})
+        desc_elem = listing.select_one('div.jobDescriptionContent, div[data-test="job-snippet"]')
         
         if desc_elem:
             return self.clean_text(desc_elem.get_text())
@@ -151,7 +199,7 @@ class GlassdoorScraper(BaseScraper):
         elif 'yesterday' in date_text:
             return 'yesterday'
         elif 'd' in date_text or 'day' in date_text:
-            days_match = re.search(r'(\d+)\s*d', date_text)
+            days_match = _DAYS_RE.search(date_text)
             if days_match:
                 return f"{days_match.group(1)} days ago"
         elif 'h' in date_text or 'hour' in date_text:
@@ -1,33 +1,84 @@
 from typing import List, Dict
+import os
 import re
 from urllib.parse import urljoin, quote
-from .base_scraper import BaseScraper
-import json
+from concurrent.futures import ThreadPoolExecutor
+from .base_scraper import BaseScraper, json_loads
+from bs4 import SoupStrainer
+
+# Job cards are div/li elements and structured data sits in script tags; nothing else is read
+_RESULTS_STRAINER = SoupStrainer(['div', 'li', 'script'])
+
+# Job card layouts Google has used, tried in order until one matches
+_JOB_CARD_QUERIES = (
+    ('div', {'class': 'PwjeAc'}),
+    ('li', {'class': 'iFjolb'}),
+    ('div', {'jsname': 'jXK9ad'})
+)
+
+_DAYS_RE = re.compile(r'(\d+)\s*day')
+_WEEKS_RE = re.compile(r'(\d+)\s*week')
+
+# Case-insensitive aria-label matches for the location/posted fallbacks
+_ARIA_LOCATION_RE = re.compile('location', re.I)
+_ARIA_POSTED_RE = re.compile('posted', re.I)
+
+# Only LD+JSON blocks mentioning JobPosting are worth decoding; Google embeds many others
+_JOB_POSTING_RE = re.compile('JobPosting')
 
 class GoogleJobsScraper(BaseScraper):
-    def __init__(self):
+    def __init__(self, http_cache: bool = False, cache_expire: int = 1800, cache_dir: str = '.'):
         super().__init__("Google Jobs")
         self.base_url = "https://www.google.com/search"
+        if http_cache:
+            self._enable_http_cache(cache_expire, cache_dir)
     
-    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True) -> List[Dict]:
-        all_jobs = []
+    def _enable_http_cache(self, expire_after: int, cache_dir: str):
+        """Serve repeated SERP requests from a local SQLite cache; only 200 responses are stored"""
+        try:
+            from requests_cache import CachedSession
+        except ImportError:
+            self.logger.warning("requests-cache is not installed, Google Jobs responses will not be cached")
+            return
         
-        for keyword in keywords:
-            try:
-                jobs = self._search_keyword(keyword, location, include_remote)
-                all_jobs.extend(jobs)
-            except Exception as e:
-                self.logger.error(f"Error searching Google Jobs for '{keyword}': {str(e)}")
+        os.makedirs(cache_dir, exist_ok=True)
+        session = CachedSession(
+            os.path.join(cache_dir, 'google_jobs_cache'),
+            backend='sqlite',
+            expire_after=expire_after,
+            allowable_methods=('GET',)
+        )
+        session.cache.delete(expired=True)
+        self.session = self._create_session(session)
+    
+    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True, cancel_event=None) -> List[Dict]:
+        if not keywords:
+            return []
         
-        seen_urls = set()
-        unique_jobs = []
+        # make_request still spaces the sends 1-3 s apart; only the response waits
+        # overlap. Results stay in keyword order
+        with ThreadPoolExecutor(max_workers=min(8, len(keywords))) as executor:
+            results = executor.map(
+                lambda keyword: self._search_keyword_safe(keyword, location, include_remote, cancel_event),
+                keywords
+            )
+            all_jobs = [job for jobs in results for job in jobs]
+        
+        jobs_by_key = {}
         for job in all_jobs:
-            job_id = f"{job.get('company', '')}_{job.get('job_title', '')}"
-            if job_id not in seen_urls:
-                seen_urls.add(job_id)
-                unique_jobs.append(job)
+            jobs_by_key.setdefault((job.get('company', ''), job.get('job_title', '')), job)
         
-        return unique_jobs
+        return list(jobs_by_key.values())
+    
+    def _search_keyword_safe(self, keyword: str, location: str, include_remote: bool, cancel_event=None) -> List[Dict]:
+        # Keywords still queued when a stop is requested are skipped
+        if self.is_cancelled(cancel_event):
+            return []
+        try:
+            return self._search_keyword(keyword, location, include_remote)
+        except Exception as e:
+            self.logger.error(f"Error searching Google Jobs for '{keyword}': {str(e)}")
+            return []
     
     def _search_keyword(self, keyword: str, location: str, include_remote: bool) -> List[Dict]:
         # Build search query
@@ -49,23 +100,25 @@ class GoogleJobsScraper(BaseScraper):
             if not response:
                 return []
             
-            soup = self.parse_html(response.text)
+            soup = self.parse_html_filtered(response.content, _RESULTS_STRAINER)
             
             jobs = []
             
-            job_cards = soup.find_all('div', {'class': 'PwjeAc'}) or \
-                       soup.find_all('li', {'class': 'iFjolb'}) or \
-                       soup.find_all('div', {'jsname': 'jXK9ad'})
+            job_cards = []
+            for name, attrs in _JOB_CARD_QUERIES:
+                job_cards = soup.find_all(name, attrs)
+                if job_cards:
+                    break
             
             for card in job_cards[:50]:
                 job = self.parse_job_listing(card)
                 if job:
                     jobs.append(job)
             
-            script_tags = soup.find_all('script', type='application/ld+json')
+            script_tags = soup.find_all('script', type='application/ld+json', string=_JOB_POSTING_RE)
             for script in script_tags:
                 try:
-                    data = json.loads(script.string)
+                    data = json_loads(script.string or '')
                     if data.get('@type') == 'JobPosting':
                         job = self._parse_structured_data(data)
                         if job:
@@ -80,20 +133,16 @@ class GoogleJobsScraper(BaseScraper):
     
     def parse_job_listing(self, listing) -> Dict:
         try:
-            title_elem = listing.find('div', {'class': 'BjJfJf'}) or \
-                        listing.find('h2') or \
-                        listing.find('div', {'role': 'heading'})
+            title_elem = listing.select_one('div.BjJfJf, h2, div[role="heading"]')
             
-            company_elem = listing.find('div', {'class': 'vNEEBe'}) or \
-                          listing.find('div', {'class': 'nJlQNd'}) or \
-                          listing.find('span', {'class': 'HBvzbc'})
+            company_elem = listing.select_one('div.vNEEBe, div.nJlQNd, span.HBvzbc')
             
             location_elem = listing.find('div', {'class': 'Qk80Jf'}) or \
                            listing.find('span', {'class': 'LL4CDc'}) or \
-                           listing.find('div', {'aria-label': lambda x: x and 'location' in x.lower()})
+                           listing.find('div', {'aria-label': _ARIA_LOCATION_RE})
             
             posted_elem = listing.find('span', {'class': 'LL4CDc'}) or \
-                         listing.find('span', {'aria-label': lambda x: x and 'posted' in x.lower()})
+                         listing.find('span', {'aria-label': _ARIA_POSTED_RE})
             
             if not (title_elem and company_elem):
                 return None
@@ -128,22 +177,21 @@ class GoogleJobsScraper(BaseScraper):
             return None
     
     def _parse_structured_data(self, data: Dict) -> Dict:
-        try:
-            return {
-                'platform': 'Google Jobs',
-                'job_title': data.get('title', ''),
-                'company': data.get('hiringOrganization', {}).get('name', ''),
-                'location': data.get('jobLocation', {}).get('address', {}).get('addressLocality', 'Warsaw'),
-                'job_url': data.get('url', ''),
-                'posted_date': data.get('datePosted', ''),
-                'description': data.get('description', '')
-            }
-        except:
-            return None
+        hiring = data.get('hiringOrganization') or {}
+        job_location = data.get('jobLocation') or {}
+        address = job_location.get('address') or {} if isinstance(job_location, dict) else {}
+        return {
+            'platform': 'Google Jobs',
+            'job_title': data.get('title', ''),
+            'company': hiring.get('name', '') if isinstance(hiring, dict) else '',
+            'location': address.get('addressLocality', 'Warsaw') if isinstance(address, dict) else 'Warsaw',
+            'job_url': data.get('url', ''),
+            'posted_date': data.get('datePosted', ''),
+            'description': data.get('description', '')
+        }
     
     def _extract_job_url(self, listing, via_site: str) -> str:
-        link_elem = listing.find('a', {'class': 'pMhGee'}) or \
-                   listing.find('a', {'jsname': 'jXK9ad'})
+        link_elem = listing.select_one('a.pMhGee, a[jsname="jXK9ad"]')
         
         if link_elem and link_elem.get('href'):
             return link_elem['href']
@@ -154,8 +202,7 @@ class GoogleJobsScraper(BaseScraper):
         return ""
     
     def _extract_description(self, listing) -> str:
-        desc_elem = listing.find('span', {'class': 'HBvzbc'}) or \
-                   listing.find('div', {'class': 'EPLEUe'})
+        desc_elem = listing.select_one('span.HBvzbc, div.EPLEUe')
         
         if desc_elem:
             return self.clean_text(desc_elem.get_text())
@@ -167,12 +214,12 @@ class GoogleJobsScraper(BaseScraper):
         if 'hour' in date_text:
             return 'today'
         elif 'day' in date_text:
-            days_match = re.search(r'(\d+)\s*day', date_text)
+            days_match = _DAYS_RE.search(date_text)
             if days_match:
                 return f"{days_match.group(1)} days ago"
             return '1 day ago'
         elif 'week' in date_text:
-            weeks_match = re.search(r'(\d+)\s*week', date_text)
+            weeks_match = _WEEKS_RE.search(date_text)
             if weeks_match:
                 days = int(weeks_match.group(1)) * 7
                 return f"{days} days ago"
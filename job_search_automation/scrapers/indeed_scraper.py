@@ -18,7 +18,7 @@ class IndeedScraper(BaseScraper):
         self.scraper = cloudscraper.create_scraper()
         self.logger = logging.getLogger('IndeedScraper')
     
-    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True) -> List[Dict]:
+    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True, cancel_event=None) -> List[Dict]:
         """Search for jobs on Indeed"""
         all_jobs = []
         
@@ -36,6 +36,8 @@ class IndeedScraper(BaseScraper):
         search_location = location_map.get(location, location)
         
         for keyword in keywords:
+            if self.is_cancelled(cancel_event):
+                break
             try:
                 jobs = self._search_keyword(keyword, search_location, include_remote)
                 all_jobs.extend(jobs)
@@ -20,7 +20,7 @@ class JustJoinITScraper(BaseScraper):
         self.scraper = cloudscraper.create_scraper()
         self.logger = logging.getLogger('JustJoinITScraper')
     
-    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True) -> List[Dict]:
+    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True, cancel_event=None) -> List[Dict]:
         """Search for jobs on JustJoinIT"""
         all_jobs = []
         
@@ -40,6 +40,8 @@ class JustJoinITScraper(BaseScraper):
         search_location = location_map.get(location, "all")
         
         for keyword in keywords:
+            if self.is_cancelled(cancel_event):
+                break
             try:
                 jobs = self._search_keyword(keyword, search_location, include_remote)
                 all_jobs.extend(jobs)
@@ -1,14 +1,25 @@
 from typing import List, Dict
 import requests
-import json
 import time
 import random
 import re
+import threading
 from urllib.parse import quote, urlencode, parse_qs, urlparse
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, json_loads
 import logging
-from fake_useragent import UserAgent
-from .linkedin_robust_methods import add_robust_methods_to_scraper
+from .linkedin_robust_methods import add_robust_methods_to_scraper, _listed_at_to_date
+
+# Major Polish cities for comprehensive coverage
+_POLAND_CITY_VARIANTS = (
+    "Poland",
+    "Warsaw, Poland",
+    "Krakow, Poland",
+    "Wroclaw, Poland",
+    "Poznan, Poland",
+    "Gdansk, Poland",
+    "Lodz, Poland",
+    "Katowice, Poland"
+)
 
 class LinkedInLuminatiScraper(BaseScraper):
     """
@@ -22,9 +33,7 @@ class LinkedInLuminatiScraper(BaseScraper):
         self.jobs_api_url = "https://www.linkedin.com/voyager/api/search/hits"
         self.jobs_search_url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
         
-        # Initialize session with rotating user agents
-        self.ua = UserAgent()
-        self.session = requests.Session()
+        # self.ua and the pooled self.session come from BaseScraper
         self.csrf_token = None
         self.jsessionid = None
         self.li_at = None
@@ -32,6 +41,7 @@ class LinkedInLuminatiScraper(BaseScraper):
         # Request tracking for rate limiting
         self.request_count = 0
         self.last_request_time = 0
+        self._delay_lock = threading.Lock()
         
         self._setup_session()
     
@@ -59,25 +69,30 @@ class LinkedInLuminatiScraper(BaseScraper):
         })
     
     def _smart_delay(self):
-        """Implement intelligent delays to avoid rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        # Adaptive delay based on request frequency
-        if self.request_count > 10:
-            delay = random.uniform(3, 7)  # Longer delay after many requests
-        elif self.request_count > 5:
-            delay = random.uniform(2, 5)  # Medium delay
-        else:
-            delay = random.uniform(1, 3)  # Short delay
-        
-        # Ensure minimum delay between requests
-        if time_since_last < 1:
-            delay = max(delay, 1.5 - time_since_last)
+        """Implement intelligent delays to avoid rate limiting; safe to call from several threads"""
+        with self._delay_lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            
+            # Adaptive delay based on request frequency
+            if self.request_count > 10:
+                delay = random.uniform(3, 7)  # Longer delay after many requests
+            elif self.request_count > 5:
+                delay = random.uniform(2, 5)  # Medium delay
+            else:
+                delay = random.uniform(1, 3)  # Short delay
+            
+            # Ensure minimum delay between requests
+            if 0 <= time_since_last < 1:
+                delay = max(delay, 1.5 - time_since_last)
+            
+            # Reserve a send slot; with concurrent callers the previous one may still be ahead
+            send_at = max(current_time, self.last_request_time) + delay
+            self.last_request_time = send_at
+            self.request_count += 1
         
-        time.sleep(delay)
-        self.last_request_time = time.time()
-        self.request_count += 1
+        # Sleep outside the lock so other threads can reserve their slots meanwhile
+        time.sleep(max(0, send_at - time.time()))
     
     def _make_robust_request(self, url: str, params: dict = None, headers: dict = None, max_retries: int = 3):
         """Make HTTP request with retry logic and error handling"""
@@ -124,7 +139,7 @@ class LinkedInLuminatiScraper(BaseScraper):
         
         return None
     
-    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True) -> List[Dict]:
+    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True, cancel_event=None) -> List[Dict]:
         """Search LinkedIn jobs using robust multi-strategy approach"""
         all_jobs = []
         
@@ -135,28 +150,29 @@ class LinkedInLuminatiScraper(BaseScraper):
         
         # Strategy 1: Guest API (most reliable)
         self.logger.info("Trying LinkedIn Guest API...")
-        guest_jobs = self._search_via_guest_api(keywords, location_variants)
+        guest_jobs = self._search_via_guest_api(keywords, location_variants, cancel_event)
         all_jobs.extend(guest_jobs)
         
         # Strategy 2: Public job search (fallback)
-        if len(all_jobs) < 10:  # If guest API didn't work well
+        # A stopped search keeps what it has instead of moving on to the fallbacks
+        if len(all_jobs) < 10 and not self.is_cancelled(cancel_event):  # If guest API didn't work well
             self.logger.info("Trying LinkedIn public job search...")
-            public_jobs = self._search_via_public_search(keywords, location_variants)
+            public_jobs = self._search_via_public_search(keywords, location_variants, cancel_event)
             all_jobs.extend(public_jobs)
         
         # Strategy 3: RSS feeds (alternative)
-        if len(all_jobs) < 5:  # If other methods failed
+        if len(all_jobs) < 5 and not self.is_cancelled(cancel_event):  # If other methods failed
             self.logger.info("Trying LinkedIn RSS feeds...")
-            rss_jobs = self._search_via_rss_feeds(keywords, location_variants)
+            rss_jobs = self._search_via_rss_feeds(keywords, location_variants, cancel_event)
             all_jobs.extend(rss_jobs)
         
         # Strategy 4: Fallback to basic scraper if enhanced methods yielded few results
-        if len(all_jobs) < 3:
+        if len(all_jobs) < 3 and not self.is_cancelled(cancel_event):
             self.logger.info("Enhanced methods yielded few results, falling back to basic scraper...")
             try:
                 from .linkedin_scraper import LinkedInScraper
                 basic_scraper = LinkedInScraper()
-                fallback_jobs = basic_scraper.search_jobs(keywords, location, include_remote)
+                fallback_jobs = basic_scraper.search_jobs(keywords, location, include_remote, cancel_event=cancel_event)
                 all_jobs.extend(fallback_jobs)
                 self.logger.info(f"Basic scraper fallback found {len(fallback_jobs)} additional jobs")
             except Exception as e:
@@ -276,7 +292,7 @@ class LinkedInLuminatiScraper(BaseScraper):
             response = self.session.get(voyager_url, timeout=30)
             
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 
                 # Parse Voyager API response
                 if 'elements' in data:
@@ -350,11 +366,8 @@ class LinkedInLuminatiScraper(BaseScraper):
             # Extract posting date
             posted_date = job_posting.get('listedAt', '')
             if posted_date:
-                import datetime
                 try:
-                    timestamp = int(posted_date) / 1000
-                    date_obj = datetime.datetime.fromtimestamp(timestamp)
-                    posted_date = date_obj.strftime('%Y-%m-%d')
+                    posted_date = _listed_at_to_date(posted_date)
                 except:
                     posted_date = ''
             
@@ -419,22 +432,11 @@ class LinkedInLuminatiScraper(BaseScraper):
         fallback_scraper = LinkedInScraper()
         return fallback_scraper.search_jobs(keywords, location, include_remote)
     
-    def _get_location_variants(self, location: str, include_remote: bool) -> List[str]:
+    @staticmethod
+    def _get_location_variants(location: str, include_remote: bool) -> List[str]:
         """Generate location variants for comprehensive search"""
-        variants = []
-        
         if location.lower() == "poland":
-            # Major Polish cities for comprehensive coverage
-            variants = [
-                "Poland",
-                "Warsaw, Poland",
-                "Krakow, Poland",
-                "Wroclaw, Poland",
-                "Poznan, Poland",
-                "Gdansk, Poland",
-                "Lodz, Poland",
-                "Katowice, Poland"
-            ]
+            variants = list(_POLAND_CITY_VARIANTS)
             if include_remote:
                 variants.extend(["Remote Poland", "Poland Remote", "Remote"])
         else:
@@ -3,185 +3,257 @@ Robust LinkedIn scraping methods for the enhanced scraper
 These methods implement multiple strategies for reliable job data extraction
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from xml.etree import ElementTree as ET
+from bs4 import SoupStrainer
+import soupsieve as sv
+from .base_scraper import json_loads
+
+# Every job card layout _parse_job_cards_from_html knows is a div or li (or nested in one)
+_JOB_CARD_STRAINER = SoupStrainer(['div', 'li'])
+
+# Card selectors for the different LinkedIn page layouts, most specific first,
+# compiled once instead of being re-parsed by soup.select on every page
+_JOB_CARD_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'div[data-entity-urn*="jobPosting"]',
+    '.base-card',
+    '.job-search-card',
+    '.jobs-search-results__list-item',
+    'li[data-occludable-job-id]',
+    '.job-card-container'
+))
+
+# Field lookups inside a job card; one selector list per field is a single subtree walk
+_TITLE_SELECTOR = sv.compile('h3 a, .job-title a, h2 a, [data-test="job-title"]')
+_COMPANY_SELECTOR = sv.compile('h4 a, .company-name, [data-test="job-company"], .job-card-container__company-name')
+_LOCATION_SELECTOR = sv.compile('.job-card-container__metadata-item, [data-test="job-location"], .job-search-card__location')
+_DATE_SELECTOR = sv.compile('time, .job-search-card__listdate, [data-test="job-posted-date"]')
+
+@lru_cache(maxsize=1024)
+def _day_to_date(day):
+    """Format a UTC day number (days since the epoch) as YYYY-MM-DD"""
+    return datetime.fromtimestamp(day * 86400, timezone.utc).strftime('%Y-%m-%d')
+
+def _listed_at_to_date(listed_at):
+    """Convert a LinkedIn listedAt epoch-milliseconds value to its UTC posting date"""
+    # Most postings in a result set share a day, so only distinct days pay for strftime
+    return _day_to_date(int(listed_at) // 86400000)
+
+def _iter_rss_items(rss_content, chunk_size=65536):
+    """Yield each RSS <item> as soon as it is parsed, feeding the document in chunks"""
+    parser = ET.XMLPullParser(events=('end',))
+    for start in range(0, len(rss_content), chunk_size):
+        parser.feed(rss_content[start:start + chunk_size])
+        for _, elem in parser.read_events():
+            if elem.tag == 'item':
+                yield elem
+    parser.close()
+    for _, elem in parser.read_events():
+        if elem.tag == 'item':
+            yield elem
+
 def add_robust_methods_to_scraper(scraper_class):
     """Add robust scraping methods to the LinkedIn scraper class"""
     
-    def _search_via_guest_api(self, keywords, location_variants):
+    def _search_via_guest_api(self, keywords, location_variants, cancel_event=None):
         """Search using LinkedIn's guest API - most reliable method"""
-        jobs = []
+        # Limit keywords and locations to avoid rate limiting
+        pairs = [(keyword, location) for keyword in keywords[:3] for location in location_variants[:5]]
+        if not pairs:
+            return []
         
-        for keyword in keywords[:3]:  # Limit keywords to avoid rate limiting
-            for location in location_variants[:5]:  # Limit locations
-                try:
-                    # LinkedIn guest API endpoint
-                    api_url = f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search"
-                    
-                    params = {
-                        'keywords': keyword,
-                        'location': location,
-                        'locationId': '',
-                        'f_TPR': 'r604800',  # Last 2 weeks
-                        'f_E': '2,3,4',     # Experience levels
-                        'sortBy': 'DD',     # Date descending
-                        'start': 0,
-                        'count': 25
-                    }
-                    
-                    headers = {
-                        'Accept': 'application/json, text/plain, */*',
-                        'Referer': f'{self.base_url}/jobs/search?keywords={keyword}&location={location}'
-                    }
-                    
-                    response = self._make_robust_request(api_url, params=params, headers=headers)
-                    
-                    if response and response.status_code == 200:
-                        try:
-                            data = response.json()
-                            if 'jobPostings' in data:
-                                for job_data in data['jobPostings'][:20]:
-                                    job = self._parse_guest_api_job(job_data)
-                                    if job:
-                                        jobs.append(job)
-                        except json.JSONDecodeError:
-                            # Try HTML parsing as fallback
-                            soup = self.parse_html(response.text)
-                            jobs.extend(self._parse_job_cards_from_html(soup))
-                    
-                except Exception as e:
-                    self.logger.debug(f"Guest API failed for {keyword} in {location}: {str(e)}")
-                    continue
+        # Requests overlap while _smart_delay keeps them paced; results stay in grid order
+        with ThreadPoolExecutor(max_workers=min(5, len(pairs))) as executor:
+            pages = executor.map(lambda pair: self._fetch_guest_api_page(*pair, cancel_event), pairs)
+            jobs = [job for page in pages for job in page]
         
         self.logger.info(f"Guest API found {len(jobs)} jobs")
         return jobs
     
-    def _search_via_public_search(self, keywords, location_variants):
-        """Search using public LinkedIn job search pages"""
+    def _fetch_guest_api_page(self, keyword, location, cancel_event=None):
+        """One guest API request for a keyword/location pair"""
         jobs = []
+        if self.is_cancelled(cancel_event):
+            return jobs
         
-        for keyword in keywords[:5]:  # More keywords allowed for public search
-            for location in location_variants[:3]:  # Fewer locations to balance
-                try:
-                    search_url = f"{self.base_url}/jobs/search"
-                    
-                    params = {
-                        'keywords': keyword,
-                        'location': location,
-                        'trk': 'public_jobs_jobs-search-bar_search-submit',
-                        'position': 1,
-                        'pageNum': 0,
-                        'f_TPR': 'r604800'
-                    }
-                    
-                    response = self._make_robust_request(search_url, params=params)
-                    
-                    if response and response.status_code == 200:
-                        soup = self.parse_html(response.text)
-                        page_jobs = self._parse_job_cards_from_html(soup)
-                        jobs.extend(page_jobs)
-                    
-                except Exception as e:
-                    self.logger.debug(f"Public search failed for {keyword} in {location}: {str(e)}")
-                    continue
+        try:
+            # LinkedIn guest API endpoint
+            api_url = f"{self.base_url}/jobs-guest/jobs/api/seeMoreJobPostings/search"
+            
+            params = {
+                'keywords': keyword,
+                'location': location,
+                'locationId': '',
+                'f_TPR': 'r604800',  # Last 2 weeks
+                'f_E': '2,3,4',     # Experience levels
+                'sortBy': 'DD',     # Date descending
+                'start': 0,
+                'count': 25
+            }
+            
+            headers = {
+                'Accept': 'application/json, text/plain, */*',
+                'Referer': f'{self.base_url}/jobs/search?keywords={keyword}&location={location}'
+            }
+            
+            response = self._make_robust_request(api_url, params=params, headers=headers)
+            
+            if response and response.status_code == 200:
+                # Dispatch on the declared type rather than failing a JSON decode first
+                if 'json' in response.headers.get('content-type', '').lower():
+                    data = json_loads(response.content)
+                    if 'jobPostings' in data:
+                        for job_data in data['jobPostings'][:20]:
+                            job = self._parse_guest_api_job(job_data)
+                            if job:
+                                jobs.append(job)
+                else:
+                    # The guest endpoint usually answers with HTML job cards
+                    soup = self.parse_html_filtered(response.content, _JOB_CARD_STRAINER)
+                    jobs.extend(self._parse_job_cards_from_html(soup))
+            
+        except Exception as e:
+            self.logger.debug(f"Guest API failed for {keyword} in {location}: {str(e)}")
         
-        self.logger.info(f"Public search found {len(jobs)} jobs")
         return jobs
     
-    def _search_via_rss_feeds(self, keywords, location_variants):
-        """Search using LinkedIn RSS feeds (alternative method)"""
-        jobs = []
+    def _search_via_public_search(self, keywords, location_variants, cancel_event=None):
+        """Search using public LinkedIn job search pages"""
+        # More keywords allowed for public search, fewer locations to balance
+        pairs = [(keyword, location) for keyword in keywords[:5] for location in location_variants[:3]]
+        if not pairs:
+            return []
         
-        for keyword in keywords[:2]:  # Very limited for RSS
-            try:
-                # LinkedIn job RSS feed URL
-                rss_url = f"{self.base_url}/jobs/search"
-                
-                params = {
-                    'keywords': keyword,
-                    'location': location_variants[0] if location_variants else 'Poland',
-                    'f_TPR': 'r604800',
-                    'format': 'rss'
-                }
-                
-                response = self._make_robust_request(rss_url, params=params)
-                
-                if response and response.status_code == 200:
-                    # Try to parse RSS or fall back to HTML
-                    if 'xml' in response.headers.get('content-type', '').lower():
-                        rss_jobs = self._parse_rss_jobs(response.text)
-                        jobs.extend(rss_jobs)
-                    else:
-                        soup = self.parse_html(response.text)
-                        jobs.extend(self._parse_job_cards_from_html(soup))
-                
-            except Exception as e:
-                self.logger.debug(f"RSS search failed for {keyword}: {str(e)}")
-                continue
+        with ThreadPoolExecutor(max_workers=min(5, len(pairs))) as executor:
+            pages = executor.map(lambda pair: self._fetch_public_search_page(*pair, cancel_event), pairs)
+            jobs = [job for page in pages for job in page]
         
-        self.logger.info(f"RSS feeds found {len(jobs)} jobs")
+        self.logger.info(f"Public search found {len(jobs)} jobs")
         return jobs
     
-    def _parse_guest_api_job(self, job_data):
-        """Parse job from LinkedIn guest API JSON response"""
+    def _fetch_public_search_page(self, keyword, location, cancel_event=None):
+        """One public job search request for a keyword/location pair"""
+        if self.is_cancelled(cancel_event):
+            return []
         try:
-            # Extract job details from API response
-            job_id = job_data.get('jobPostingId', '')
-            title = job_data.get('title', '')
-            company_info = job_data.get('companyDetails', {})
-            company = company_info.get('companyName', '') or company_info.get('company', {}).get('name', '')
-            location = job_data.get('formattedLocation', '')
+            search_url = f"{self.base_url}/jobs/search"
             
-            # Build job URL
-            job_url = f"{self.base_url}/jobs/view/{job_id}" if job_id else ""
+            params = {
+                'keywords': keyword,
+                'location': location,
+                'trk': 'public_jobs_jobs-search-bar_search-submit',
+                'position': 1,
+                'pageNum': 0,
+                'f_TPR': 'r604800'
+            }
             
-            # Extract posting date
-            posted_date = ''
-            if 'listedAt' in job_data:
-                try:
-                    import datetime
-                    timestamp = int(job_data['listedAt']) / 1000
-                    date_obj = datetime.datetime.fromtimestamp(timestamp)
-                    posted_date = date_obj.strftime('%Y-%m-%d')
-                except:
-                    pass
+            response = self._make_robust_request(search_url, params=params)
             
-            # Extract description
-            description = job_data.get('description', {})
-            if isinstance(description, dict):
-                description = description.get('text', '')
-            elif not isinstance(description, str):
-                description = str(description)
+            if response and response.status_code == 200:
+                soup = self.parse_html_filtered(response.content, _JOB_CARD_STRAINER)
+                return self._parse_job_cards_from_html(soup)
             
-            return {
-                'platform': 'LinkedIn-Primary',
-                'job_title': title,
-                'company': company,
+        except Exception as e:
+            self.logger.debug(f"Public search failed for {keyword} in {location}: {str(e)}")
+        
+        return []
+    
+    def _search_via_rss_feeds(self, keywords, location_variants, cancel_event=None):
+        """Search using LinkedIn RSS feeds (alternative method)"""
+        keywords = keywords[:2]  # Very limited for RSS
+        if not keywords:
+            return []
+        location = location_variants[0] if location_variants else 'Poland'
+        
+        with ThreadPoolExecutor(max_workers=len(keywords)) as executor:
+            pages = executor.map(lambda keyword: self._fetch_rss_page(keyword, location, cancel_event), keywords)
+            jobs = [job for page in pages for job in page]
+        
+        self.logger.info(f"RSS feeds found {len(jobs)} jobs")
+        return jobs
+    
+    def _fetch_rss_page(self, keyword, location, cancel_event=None):
+        """One RSS feed request for a keyword"""
+        if self.is_cancelled(cancel_event):
+            return []
+        try:
+            # LinkedIn job RSS feed URL
+            rss_url = f"{self.base_url}/jobs/search"
+            
+            params = {
+                'keywords': keyword,
                 'location': location,
-                'job_url': job_url,
-                'posted_date': posted_date,
-                'description': description[:500]  # Limit description length
+                'f_TPR': 'r604800',
+                'format': 'rss'
             }
             
+            response = self._make_robust_request(rss_url, params=params)
+            
+            if response and response.status_code == 200:
+                # Try to parse RSS or fall back to HTML
+                if 'xml' in response.headers.get('content-type', '').lower():
+                    return self._parse_rss_jobs(response.content)
+                soup = self.parse_html_filtered(response.content, _JOB_CARD_STRAINER)
+                return self._parse_job_cards_from_html(soup)
+            
         except Exception as e:
-            self.logger.debug(f"Error parsing guest API job: {str(e)}")
+            self.logger.debug(f"RSS search failed for {keyword}: {str(e)}")
+        
+        return []
+    
+    def _parse_guest_api_job(self, job_data):
+        """Parse job from LinkedIn guest API JSON response"""
+        if not isinstance(job_data, dict):
             return None
+        
+        # Extract job details from API response
+        job_id = job_data.get('jobPostingId', '')
+        title = job_data.get('title', '')
+        company_info = job_data.get('companyDetails') or {}
+        company = ''
+        if isinstance(company_info, dict):
+            nested_company = company_info.get('company') or {}
+            company = company_info.get('companyName', '') or \
+                (nested_company.get('name', '') if isinstance(nested_company, dict) else '')
+        location = job_data.get('formattedLocation', '')
+        
+        # Build job URL
+        job_url = f"{self.base_url}/jobs/view/{job_id}" if job_id else ""
+        
+        # Extract posting date
+        posted_date = ''
+        if 'listedAt' in job_data:
+            try:
+                posted_date = _listed_at_to_date(job_data['listedAt'])
+            except (TypeError, ValueError, OverflowError, OSError):
+                pass
+        
+        # Extract description
+        description = job_data.get('description', {})
+        if isinstance(description, dict):
+            description = description.get('text') or ''
+        if not isinstance(description, str):
+            description = str(description)
+        
+        return {
+            'platform': 'LinkedIn-Primary',
+            'job_title': title,
+            'company': company,
+            'location': location,
+            'job_url': job_url,
+            'posted_date': posted_date,
+            'description': description[:500]  # Limit description length
+        }
     
     def _parse_job_cards_from_html(self, soup):
         """Parse job cards from HTML soup"""
         jobs = []
         
-        # Multiple selectors for different LinkedIn page layouts
-        job_selectors = [
-            'div[data-entity-urn*="jobPosting"]',
-            '.base-card',
-            '.job-search-card',
-            '.jobs-search-results__list-item',
-            'li[data-occludable-job-id]',
-            '.job-card-container'
-        ]
-        
         job_elements = []
-        for selector in job_selectors:
-            elements = soup.select(selector)
+        for selector in _JOB_CARD_SELECTORS:
+            elements = selector.select(soup)
             if elements:
                 job_elements = elements
                 break
@@ -201,35 +273,16 @@ def add_robust_methods_to_scraper(scraper_class):
         """Parse individual job element from HTML"""
         try:
             # Extract title
-            title_selectors = ['h3 a', '.job-title a', 'h2 a', '[data-test="job-title"]']
-            title = ""
-            title_elem = None
-            
-            for selector in title_selectors:
-                title_elem = element.select_one(selector)
-                if title_elem:
-                    title = self.clean_text(title_elem.get_text())
-                    break
+            title_elem = _TITLE_SELECTOR.select_one(element)
+            title = self.clean_text(title_elem.get_text()) if title_elem else ""
             
             # Extract company
-            company_selectors = ['h4 a', '.company-name', '[data-test="job-company"]', '.job-card-container__company-name']
-            company = ""
-            
-            for selector in company_selectors:
-                company_elem = element.select_one(selector)
-                if company_elem:
-                    company = self.clean_text(company_elem.get_text())
-                    break
+            company_elem = _COMPANY_SELECTOR.select_one(element)
+            company = self.clean_text(company_elem.get_text()) if company_elem else ""
             
             # Extract location
-            location_selectors = ['.job-card-container__metadata-item', '[data-test="job-location"]', '.job-search-card__location']
-            location = ""
-            
-            for selector in location_selectors:
-                location_elem = element.select_one(selector)
-                if location_elem:
-                    location = self.clean_text(location_elem.get_text())
-                    break
+            location_elem = _LOCATION_SELECTOR.select_one(element)
+            location = self.clean_text(location_elem.get_text()) if location_elem else ""
             
             # Extract job URL
             job_url = ""
@@ -241,17 +294,13 @@ def add_robust_methods_to_scraper(scraper_class):
                     job_url = href
             
             # Extract posting date
-            date_selectors = ['time', '.job-search-card__listdate', '[data-test="job-posted-date"]']
             posted_date = ""
-            
-            for selector in date_selectors:
-                date_elem = element.select_one(selector)
-                if date_elem:
-                    if date_elem.get('datetime'):
-                        posted_date = date_elem['datetime']
-                    else:
-                        posted_date = self.clean_text(date_elem.get_text())
-                    break
+            date_elem = _DATE_SELECTOR.select_one(element)
+            if date_elem:
+                if date_elem.get('datetime'):
+                    posted_date = date_elem['datetime']
+                else:
+                    posted_date = self.clean_text(date_elem.get_text())
             
             # Basic validation
             if not (title and company):
@@ -276,11 +325,10 @@ def add_robust_methods_to_scraper(scraper_class):
         jobs = []
         
         try:
-            from xml.etree import ElementTree as ET
-            root = ET.fromstring(rss_content)
-            
-            # Find job items in RSS
-            for item in root.findall('.//item')[:20]:
+            # Stream job items; parsing stops after the first 20 and each item is freed once read
+            for index, item in enumerate(_iter_rss_items(rss_content)):
+                if index >= 20:
+                    break
                 try:
                     title = item.find('title')
                     title = title.text if title is not None else ""
@@ -310,6 +358,8 @@ def add_robust_methods_to_scraper(scraper_class):
                 except Exception as e:
                     self.logger.debug(f"Error parsing RSS item: {str(e)}")
                     continue
+                finally:
+                    item.clear()
                     
         except Exception as e:
             self.logger.debug(f"Error parsing RSS content: {str(e)}")
@@ -318,8 +368,11 @@ def add_robust_methods_to_scraper(scraper_class):
     
     # Add methods to the scraper class
     scraper_class._search_via_guest_api = _search_via_guest_api
+    scraper_class._fetch_guest_api_page = _fetch_guest_api_page
     scraper_class._search_via_public_search = _search_via_public_search
+    scraper_class._fetch_public_search_page = _fetch_public_search_page
     scraper_class._search_via_rss_feeds = _search_via_rss_feeds
+    scraper_class._fetch_rss_page = _fetch_rss_page
     scraper_class._parse_guest_api_job = _parse_guest_api_job
     scraper_class._parse_job_cards_from_html = _parse_job_cards_from_html
     scraper_class._parse_html_job_element = _parse_html_job_element
@@ -4,13 +4,25 @@ from urllib.parse import urljoin, quote
 from .base_scraper import BaseScraper
 import cloudscraper
 
+# Major Polish cities for comprehensive coverage
+_POLAND_CITY_VARIANTS = (
+    "Poland",
+    "Warsaw, Poland",
+    "Krakow, Poland",
+    "Wroclaw, Poland",
+    "Poznan, Poland",
+    "Gdansk, Poland",
+    "Lodz, Poland",
+    "Katowice, Poland"
+)
+
 class LinkedInScraper(BaseScraper):
     def __init__(self):
         super().__init__("LinkedIn")
         self.base_url = "https://www.linkedin.com/jobs/search"
         self.scraper = cloudscraper.create_scraper()
     
-    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True) -> List[Dict]:
+    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True, cancel_event=None) -> List[Dict]:
         all_jobs = []
         
         # Search multiple location variants for Poland
@@ -18,6 +30,8 @@ class LinkedInScraper(BaseScraper):
         
         for keyword in keywords:
             for loc_variant in location_variants:
+                if self.is_cancelled(cancel_event):
+                    break
                 try:
                     jobs = self._search_keyword(keyword, loc_variant)
                     all_jobs.extend(jobs)
@@ -33,22 +47,11 @@ class LinkedInScraper(BaseScraper):
         
         return unique_jobs
     
-    def _get_location_variants(self, location: str, include_remote: bool) -> List[str]:
+    @staticmethod
+    def _get_location_variants(location: str, include_remote: bool) -> List[str]:
         """Generate location variants for Poland-wide search"""
-        variants = []
-        
         if location.lower() == "poland":
-            # Major Polish cities for comprehensive coverage
-            variants = [
-                "Poland",
-                "Warsaw, Poland",
-                "Krakow, Poland",
-                "Wroclaw, Poland",
-                "Poznan, Poland",
-                "Gdansk, Poland",
-                "Lodz, Poland",
-                "Katowice, Poland"
-            ]
+            variants = list(_POLAND_CITY_VARIANTS)
             if include_remote:
                 variants.extend(["Remote Poland", "Poland Remote"])
         else:
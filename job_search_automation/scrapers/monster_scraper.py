@@ -12,6 +12,17 @@ from bs4 import BeautifulSoup
 import logging
 import json
 
+# Location strings Monster understands for Polish searches
+_LOCATION_MAP = {
+    "Poland": "Poland",
+    "Warsaw": "Warsaw, Poland",
+    "Krakow": "Krakow, Poland",
+    "Wroclaw": "Wroclaw, Poland",
+    "Poznan": "Poznan, Poland",
+    "Gdansk": "Gdansk, Poland",
+    "Remote Poland": "Remote"
+}
+
 class MonsterScraper(BaseScraper):
     def __init__(self):
         super().__init__("Monster")
@@ -19,7 +30,7 @@ class MonsterScraper(BaseScraper):
         self.scraper = cloudscraper.create_scraper()
         self.logger = logging.getLogger('MonsterScraper')
     
-    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True) -> List[Dict]:
+    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True, cancel_event=None) -> List[Dict]:
         """Search for jobs on Monster"""
         all_jobs = []
         
@@ -27,6 +38,8 @@ class MonsterScraper(BaseScraper):
         location_formatted = self._format_location(location)
         
         for keyword in keywords:
+            if self.is_cancelled(cancel_event):
+                break
             try:
                 jobs = self._search_keyword(keyword, location_formatted, include_remote)
                 all_jobs.extend(jobs)
@@ -43,18 +56,10 @@ class MonsterScraper(BaseScraper):
         
         return unique_jobs
     
-    def _format_location(self, location: str) -> str:
+    @staticmethod
+    def _format_location(location: str) -> str:
         """Format location for Monster search"""
-        location_map = {
-            "Poland": "Poland",
-            "Warsaw": "Warsaw, Poland",
-            "Krakow": "Krakow, Poland",
-            "Wroclaw": "Wroclaw, Poland",
-            "Poznan": "Poznan, Poland",
-            "Gdansk": "Gdansk, Poland",
-            "Remote Poland": "Remote"
-        }
-        return location_map.get(location, location)
+        return _LOCATION_MAP.get(location, location)
     
     def _search_keyword(self, keyword: str, location: str, include_remote: bool) -> List[Dict]:
         """Search for specific keyword on Monster"""
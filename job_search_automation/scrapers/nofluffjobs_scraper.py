@@ -20,7 +20,7 @@ class NoFluffJobsScraper(BaseScraper):
         self.scraper = cloudscraper.create_scraper()
         self.logger = logging.getLogger('NoFluffJobsScraper')
     
-    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True) -> List[Dict]:
+    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True, cancel_event=None) -> List[Dict]:
         """Search for jobs on NoFluffJobs"""
         all_jobs = []
         
@@ -40,6 +40,8 @@ class NoFluffJobsScraper(BaseScraper):
         search_location = location_map.get(location, "pl")
         
         for keyword in keywords:
+            if self.is_cancelled(cancel_event):
+                break
             try:
                 jobs = self._search_keyword(keyword, search_location, include_remote)
                 all_jobs.extend(jobs)
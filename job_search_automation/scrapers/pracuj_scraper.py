@@ -3,18 +3,32 @@ import re
 from urllib.parse import urljoin, quote
 from .base_scraper import BaseScraper
 
+# Pracuj.pl URL slugs for Polish cities; empty means all of Poland
+_LOCATION_SLUGS = {
+    "poland": "",
+    "warsaw": "warszawa",
+    "krakow": "krakow",
+    "wroclaw": "wroclaw",
+    "poznan": "poznan",
+    "gdansk": "gdansk",
+    "lodz": "lodz",
+    "katowice": "katowice"
+}
+
 class PracujScraper(BaseScraper):
     def __init__(self):
         super().__init__("Pracuj.pl")
         self.base_url = "https://www.pracuj.pl/praca"
     
-    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True) -> List[Dict]:
+    def search_jobs(self, keywords: List[str], location: str = "Poland", include_remote: bool = True, cancel_event=None) -> List[Dict]:
         all_jobs = []
         
         # Convert location for Pracuj.pl
         location_formatted = self._format_location(location)
         
         for keyword in keywords:
+            if self.is_cancelled(cancel_event):
+                break
             try:
                 jobs = self._search_keyword(keyword, location_formatted, include_remote)
                 all_jobs.extend(jobs)
@@ -30,21 +44,11 @@ class PracujScraper(BaseScraper):
         
         return unique_jobs
     
-    def _format_location(self, location: str) -> str:
+    @staticmethod
+    def _format_location(location: str) -> str:
         """Format location for Pracuj.pl URLs"""
-        location_map = {
-            "poland": "",  # Empty means all of Poland
-            "warsaw": "warszawa",
-            "krakow": "krakow", 
-            "wroclaw": "wroclaw",
-            "poznan": "poznan",
-            "gdansk": "gdansk",
-            "lodz": "lodz",
-            "katowice": "katowice"
-        }
-        
         location_lower = location.lower().replace(", poland", "").strip()
-        return location_map.get(location_lower, "")
+        return _LOCATION_SLUGS.get(location_lower, "")
     
     def _search_keyword(self, keyword: str, location: str, include_remote: bool) -> List[Dict]:
         keyword_formatted = keyword.replace(' ', '%20')
@@ -0,0 +1,84 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import JobSearchAutomation
+
+class _StubScraper:
+    """Returns fixed jobs once every platform has started searching"""
+
+    def __init__(self, platform_name, started):
+        self.platform_name = platform_name
+        self.started = started
+
+    def search_jobs(self, keywords, location, include_remote, cancel_event=None):
+        self.started.wait(timeout=5)
+        return [
+            {'company': self.platform_name, 'job_title': f'Engineer {i}', 'description': '', 'posted_date': 'today'}
+            for i in range(5)
+        ]
+
+class _StubTranslator:
+    """Records how many threads are inside translate_job at the same time"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def translate_job(self, job):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return job
+
+class _StubMatcher:
+    def is_job_recent(self, posted_date, max_days):
+        return True
+
+    def extract_experience_requirement(self, description):
+        return 0
+
+    def calculate_match_score(self, job):
+        return 100, []
+
+class ConcurrentPlatformSearchTest(unittest.TestCase):
+    def _automation(self, platform_names):
+        automation = JobSearchAutomation.__new__(JobSearchAutomation)
+        automation.config = mock.Mock(
+            JOB_SEARCH_KEYWORDS=['engineer'],
+            SEARCH_LOCATION='Poland',
+            INCLUDE_REMOTE=True,
+            MAX_JOB_AGE_DAYS=14,
+            MIN_MATCH_PCT=70,
+            OUTPUT_FORMATS=[]
+        )
+        automation.output_manager = mock.Mock()
+        automation.translator = _StubTranslator()
+        automation._translate_lock = threading.Lock()
+        automation.job_matcher = _StubMatcher()
+        started = threading.Barrier(len(platform_names))
+        automation.scrapers = {
+            name: _StubScraper(name, started) for name in platform_names
+        }
+        return automation
+
+    def test_two_platforms_at_once_translate_one_job_at_a_time(self):
+        automation = self._automation(['Glassdoor', 'Pracuj.pl'])
+
+        jobs = automation.run()
+
+        self.assertEqual(len(jobs), 10)
+        self.assertEqual({job['company'] for job in jobs}, {'Glassdoor', 'Pracuj.pl'})
+        self.assertEqual(automation.translator.max_active, 1)
+
+if __name__ == '__main__':
+    unittest.main()
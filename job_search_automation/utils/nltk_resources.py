@@ -0,0 +1,11 @@
+import nltk
+
+_NLTK_RESOURCES = (('stopwords', 'corpora/stopwords'), ('punkt', 'tokenizers/punkt'))
+
+def ensure_nltk_resources():
+    """Download the NLTK corpora the matchers use, skipping any already installed"""
+    for resource, path in _NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            nltk.download(resource, quiet=True)
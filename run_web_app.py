@@ -16,7 +16,6 @@ import threading
 sys.path.append(os.path.join(os.path.dirname(__file__), 'job_search_automation'))
 
 from config.settings import Config
-from main import JobSearchAutomation
 
 app = Flask(__name__)
 app.secret_key = 'job-finder-secret-key-2025'
@@ -139,6 +138,9 @@ def start_search():
         # Run search in background
         def run_search():
             try:
+                # Deferred so heavy scraper/matcher imports happen on first search
+                from main import JobSearchAutomation
+                
                 # Configure job search
                 config = Config()
                 config.JOB_SEARCH_KEYWORDS = [kw.strip() for kw in data.get('keywords', '').split(',')]
@@ -10,24 +10,28 @@ import json
 import sqlite3
 import logging
 import threading
-from datetime import datetime
+import time
 from pathlib import Path
 from flask import Flask, request, jsonify, render_template, send_file, session
 from flask_socketio import SocketIO, emit, join_room
 from werkzeug.utils import secure_filename
+from werkzeug.exceptions import RequestEntityTooLarge
 import uuid
 
 # Add the job_search_automation directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'job_search_automation'))
 
 from config.settings import Config
-from main import JobSearchAutomation
-from utils.resume_parser import ResumeParser
 
-# Configure logging
+# Configure logging; main is imported lazily, so its basicConfig never takes effect
+# here and the job_search.log file handler has to be set up by the web app itself
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('job_search.log'),
+        logging.StreamHandler()
+    ]
 )
 logger = logging.getLogger('WebJobFinder')
 
@@ -35,6 +39,8 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = os.urandom(24)
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['RESULTS_FOLDER'] = 'results'
+# Resumes are a few KB of text; reject anything larger before it is buffered
+app.config['MAX_CONTENT_LENGTH'] = 2 * 1024 * 1024
 
 # Create required directories
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
@@ -91,38 +97,42 @@ class WebJobSearchLogger:
     def __init__(self, session_id):
         self.session_id = session_id
     
-    def info(self, message):
-        logger.info(f"[{self.session_id}] {message}")
+    def _emit(self, level, message):
+        # time.strftime formats the current local time without building a datetime per message
         socketio.emit('log_message', {
             'message': message,
-            'level': 'info',
-            'timestamp': datetime.now().strftime('%H:%M:%S')
+            'level': level,
+            'timestamp': time.strftime('%H:%M:%S')
         }, room=self.session_id)
     
+    def info(self, message):
+        logger.info(f"[{self.session_id}] {message}")
+        self._emit('info', message)
+    
     def error(self, message):
         logger.error(f"[{self.session_id}] {message}")
-        socketio.emit('log_message', {
-            'message': message,
-            'level': 'error',
-            'timestamp': datetime.now().strftime('%H:%M:%S')
-        }, room=self.session_id)
+        self._emit('error', message)
     
     def warning(self, message):
         logger.warning(f"[{self.session_id}] {message}")
-        socketio.emit('log_message', {
-            'message': message,
-            'level': 'warning',
-            'timestamp': datetime.now().strftime('%H:%M:%S')
-        }, room=self.session_id)
+        self._emit('warning', message)
 
 # Store active search threads
 active_searches = {}
 
+# Cancellation flags for running searches, keyed by session id
+search_cancel_events = {}
+
 @app.route('/')
 def index():
     """Serve the main application page"""
     return render_template('index.html')
 
+@app.errorhandler(413)
+def request_too_large(e):
+    """Reject uploads above MAX_CONTENT_LENGTH"""
+    return jsonify({'success': False, 'error': 'Resume is too large (max 2 MB)'}), 413
+
 @app.route('/api/upload_resume', methods=['POST'])
 def upload_resume():
     """Handle resume file upload"""
@@ -159,6 +169,9 @@ def upload_resume():
         
         return jsonify({'success': False, 'error': 'No resume provided'})
     
+    except RequestEntityTooLarge:
+        # Raised when the body is first read; let the 413 handler answer
+        raise
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)})
 
@@ -190,6 +203,8 @@ def start_search():
         conn.commit()
         conn.close()
         
+        search_cancel_events[session_id] = threading.Event()
+        
         # Start search in background thread
         search_thread = threading.Thread(
             target=run_job_search,
@@ -220,15 +235,20 @@ def run_job_search(session_id, search_params):
         conn.commit()
         conn.close()
         
+        # Deferred so the scrapers and matchers (sklearn, nltk, cloudscraper)
+        # are only loaded once a search actually runs
+        from main import JobSearchAutomation
+        
         # Configure job search
         config = Config()
         resume_file = os.path.join(app.config['UPLOAD_FOLDER'], f"{session_id}_resume.txt")
         
         # Find the actual resume file
-        for file in os.listdir(app.config['UPLOAD_FOLDER']):
-            if file.startswith(session_id):
-                resume_file = os.path.join(app.config['UPLOAD_FOLDER'], file)
-                break
+        with os.scandir(app.config['UPLOAD_FOLDER']) as entries:
+            for entry in entries:
+                if entry.name.startswith(session_id) and entry.is_file():
+                    resume_file = entry.path
+                    break
         
         config.RESUME_FILE = resume_file
         config.SEARCH_LOCATION = search_params.get('location', 'Poland')
@@ -283,7 +303,9 @@ def run_job_search(session_id, search_params):
         web_logger.info("🔍 Searching LinkedIn, Glassdoor, Pracuj.pl, and Google Jobs...")
         
         # Run the search
-        results = automation.run()
+        cancel_event = search_cancel_events.get(session_id)
+        results = automation.run(cancel_event=cancel_event)
+        status = 'cancelled' if cancel_event is not None and cancel_event.is_set() else 'completed'
         
         # Store results in database
         conn = sqlite3.connect('job_search.db')
@@ -311,15 +333,18 @@ def run_job_search(session_id, search_params):
             UPDATE search_sessions 
             SET status = ?, total_jobs = ?, results_file = ?
             WHERE id = ?
-        ''', ('completed', len(results), config.CSV_OUTPUT, session_id))
+        ''', (status, len(results), config.CSV_OUTPUT, session_id))
         
         conn.commit()
         conn.close()
         
-        web_logger.info(f"✅ Search completed! Found {len(results)} matching jobs")
+        if status == 'cancelled':
+            web_logger.warning(f"⏹️ Search stopped. Kept {len(results)} matching jobs found so far")
+        else:
+            web_logger.info(f"✅ Search completed! Found {len(results)} matching jobs")
         
-        # Emit completion event
-        socketio.emit('search_completed', {
+        # Emit completion event; a stopped search still reports the partial results it saved
+        socketio.emit('search_cancelled' if status == 'cancelled' else 'search_completed', {
             'session_id': session_id,
             'job_count': len(results),
             'csv_file': config.CSV_OUTPUT,
@@ -345,6 +370,17 @@ def run_job_search(session_id, search_params):
         # Remove from active searches
         if session_id in active_searches:
             del active_searches[session_id]
+        search_cancel_events.pop(session_id, None)
+
+@app.route('/api/stop_search/<session_id>', methods=['POST'])
+def stop_search(session_id):
+    """Ask a running search to stop; scrapers skip their remaining requests and scoring ends after the current job"""
+    cancel_event = search_cancel_events.get(session_id)
+    if cancel_event is None:
+        return jsonify({'success': False, 'error': 'No running search for this session'})
+    
+    cancel_event.set()
+    return jsonify({'success': True, 'message': 'Stop requested'})
 
 @app.route('/api/search_status/<session_id>')
 def search_status(session_id):